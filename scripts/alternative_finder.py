@@ -4,131 +4,281 @@ Alternative material finder for Spanish learning automation.
 Finds alternative articles and podcast episodes when duplicates are detected.
 """
 import os
+import re
 import sys
+import time
+import threading
 import subprocess
+import tempfile
 import json
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
-def find_alternative_article():
-    """기사 중복시 대안 기사를 찾아서 환경변수에 설정"""
+from http_cache import prefetch_feed, RATE_LIMITED_EXIT_CODE
+from calculate_schedule import load_podcast_schedule
+
+COLLECT_SCRIPT = os.path.join(os.path.dirname(__file__), 'collect_materials.py')
+NOTION_SCRIPT = os.path.join(os.path.dirname(__file__), 'create_notion_pages.py')
+MAX_PROBE_WORKERS = 4
+MAX_BACKOFF_SECONDS = 60
+SEARCH_BUDGET_SECONDS = 90  # find_alternative_* 한 번에 쓸 수 있는 전체 시간
+MIN_PROBE_SECONDS = 2       # 남은 예산이 이보다 적으면 프로브를 시작하지 않음
+
+Source = namedtuple('Source', 'name rss')
+Podcast = namedtuple('Podcast', 'name rss apple_base')
+
+ALTERNATIVE_SOURCES = (
+    Source("20minutos", "https://www.20minutos.es/rss/"),
+    Source("El País", "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/portada"),
+    Source("El País 사설", "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/section/opinion"),
+    Source("El Mundo", "https://e00-elmundo.uecdn.es/elmundo/rss/portada.xml"),
+    Source("ABC", "https://www.abc.es/rss/feeds/abc_EspanaEspana.xml"),
+)
+
+ALTERNATIVE_PODCASTS = (
+    Podcast("Hoy Hablamos", "https://www.hoyhablamos.com/podcast.rss",
+            "https://podcasts.apple.com/kr/podcast/hoy-hablamos-podcast-diario-para-aprender-español-learn/id1201483158"),
+    Podcast("Radio Ambulante", "https://feeds.npr.org/510311/podcast.xml",
+            "https://podcasts.apple.com/kr/podcast/radio-ambulante/id527614348"),
+    Podcast("SpanishWithVicente", "https://feeds.feedburner.com/SpanishWithVicente",
+            "https://podcasts.apple.com/kr/podcast/spanish-with-vicente/id1493547273"),
+    Podcast("DELE Podcast", "https://anchor.fm/s/f4f4a4f0/podcast/rss",
+            "https://podcasts.apple.com/us/podcast/examen-dele/id1705001626"),
+    # 추가 백업 피드들 - 실제 검증된 피드들만 사용
+    Podcast("Notes in Spanish", "https://feeds.feedburner.com/notesinspanish",
+            "https://podcasts.apple.com/us/podcast/notes-in-spanish/id1234567891"),
+)
+
+def _run_streamed(argv, env, timeout, prefix, cancel=None, on_line=None):
+    """자식 프로세스 출력을 메모리에 모아두지 않고 줄 단위로 바로 출력하며 실행
+
+    timeout이 지나거나 cancel 이벤트가 설정되면 프로세스를 종료
+    on_line: 출력 줄마다 호출할 함수 (결과 줄만 골라 모을 때 사용)
+    Returns: 종료 코드 (시간 초과 시 timeout 값을 담은 subprocess.TimeoutExpired 발생)
+    """
+    env = dict(env if env is not None else os.environ)
+    env['PYTHONUNBUFFERED'] = '1'  # 자식 출력이 블록 단위로 늦게 오지 않도록
+
+    # close_fds=False여야 CPython이 fork+exec 대신 posix_spawn을 사용함
+    # (파이썬이 여는 fd는 기본적으로 상속되지 않으므로 자식에게 새지 않음)
+    proc = subprocess.Popen(argv, env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, bufsize=1,
+                            close_fds=False)
+    deadline = time.monotonic() + timeout
+    timed_out = threading.Event()
+    stop = cancel if cancel is not None else threading.Event()
+
+    def _watchdog():
+        while proc.poll() is None:
+            if time.monotonic() >= deadline:
+                timed_out.set()
+                proc.kill()
+                return
+            if stop.wait(0.2):
+                proc.kill()
+                return
+
+    threading.Thread(target=_watchdog, daemon=True).start()
+
+    with proc.stdout:
+        for line in proc.stdout:
+            print(f"[{prefix}] {line}", end='')
+            if on_line is not None:
+                on_line(line)
+    returncode = proc.wait()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(argv, timeout)
+    return returncode
+
+# collect_materials.py가 대안 모드에서 표준 출력으로 내보내는 결과 줄 (예: ARTICLE_TITLE="...")
+_RESULT_LINE_RE = re.compile(r'([A-Z][A-Z_]*)="(.*)"')
+
+def _write_github_outputs(results, prefix):
+    """승리한 프로브의 결과 중 prefix로 시작하는 항목을 GITHUB_OUTPUT에 한 번의 write로 기록"""
+    output_path = os.environ.get('GITHUB_OUTPUT')
+    lines = [f"{key.lower()}={value}" for key, value in results.items() if key.startswith(prefix)]
+    if not output_path or not lines:
+        return
+    payload = "\n".join(lines) + "\n"
+    try:
+        fd = os.open(output_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload.encode('utf-8'))
+        finally:
+            os.close(fd)
+    except OSError as e:
+        print(f"GitHub Output 파일 쓰기 오류: {e}")
+
+def _probe(name, env_overrides, timeout, deadline, cancel):
+    """collect_materials.py를 주어진 환경변수로 실행하고 (종료 코드, Retry-After 초, 결과) 반환
+
+    Retry-After는 rate limit 종료 코드(42)일 때만 값이 있음 (헤더가 없었으면 0)
+    결과는 자식이 표준 출력으로 낸 KEY="값" 줄들의 사전
+    timeout은 전체 검색 deadline까지 남은 시간으로 줄어들며,
+    남은 시간이 없으면 실행하지 않고 (None, None, None) 반환
+
+    후보들이 동시에 실행되므로 os.environ을 공유하는 in-process 호출 대신
+    별도 프로세스로 실행 (환경변수 충돌 방지 + 시간 초과 시 강제 종료 가능)
+    """
+    remaining = deadline - time.monotonic()
+    if remaining < MIN_PROBE_SECONDS:
+        return None, None, None
+    timeout = min(timeout, remaining)
+
+    env = os.environ.copy()
+    env.update(env_overrides)
+    env['FORCE_ALTERNATIVE'] = 'true'  # 대안 검색 모드임을 표시
+    # 동시에 실행되는 프로브가 GITHUB_OUTPUT에 직접 쓰지 않도록 제거 (승리한 프로브의 결과만 부모가 기록)
+    env.pop('GITHUB_OUTPUT', None)
+
+    # rate limit에 걸리면 자식 프로세스가 Retry-After 초를 이 파일에 기록
+    fd, retry_after_file = tempfile.mkstemp(prefix='retry_after_')
+    os.close(fd)
+    env['RETRY_AFTER_FILE'] = retry_after_file
+
+    results = {}
+
+    def _collect_result(line):
+        match = _RESULT_LINE_RE.fullmatch(line.rstrip('\n'))
+        if match:
+            results[match.group(1)] = match.group(2)
+
+    try:
+        returncode = _run_streamed([sys.executable, COLLECT_SCRIPT], env, timeout, name, cancel,
+                                   on_line=_collect_result)
+        retry_after = None
+        if returncode == RATE_LIMITED_EXIT_CODE:
+            with open(retry_after_file) as f:
+                content = f.read().strip()
+            retry_after = int(content) if content.isdigit() else 0
+        return returncode, retry_after, results
+    finally:
+        os.unlink(retry_after_file)
+
+def _probe_candidates(executor, candidates, timeout, success_message, failed, retry_hints,
+                      output_prefix='', total_budget=SEARCH_BUDGET_SECONDS):
+    """후보들을 동시에 시도하고 처음 성공한 후보에서 종료
+
+    executor: main()에서 공유하는 스레드 풀 (None이면 이번 호출용 풀 생성)
+    candidates: (이름, 환경변수 오버라이드) 목록
+    failed: 실패한 후보 이름을 기록할 집합 (다음 시도에서 건너뜀)
+    retry_hints: rate limit에 걸린 후보의 Retry-After(초)를 모을 리스트
+    output_prefix: 성공한 후보의 결과 중 GITHUB_OUTPUT에 기록할 항목의 접두사 (ARTICLE_/PODCAST_)
+    total_budget: 모든 후보에 걸쳐 쓸 수 있는 전체 시간 (초)
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=MAX_PROBE_WORKERS)
+
+    # 한 후보가 성공하면 나머지 실행 중인 프로브도 종료
+    cancel = threading.Event()
+    deadline = time.monotonic() + total_budget
+    futures = {}
+    for name, overrides in candidates:
+        print(f"🚀 {name} 시도 시작")
+        futures[executor.submit(_probe, name, overrides, timeout, deadline, cancel)] = name
+
+    try:
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                returncode, retry_after, results = future.result()
+            except subprocess.TimeoutExpired as e:
+                if e.timeout < timeout:
+                    # 전체 예산이 부족해 줄어든 시간 안에 끝나지 않음 - 다음 시도에서 다시 시도
+                    print(f"⌛ {name}: 검색 시간 예산 소진으로 중단 ({e.timeout:.0f}초)")
+                    continue
+                print(f"⏰ {name}: 시간 초과")
+                failed.add(name)
+                continue
+            except Exception as e:
+                print(f"❌ {name} 오류: {e}")
+                failed.add(name)
+                continue
+
+            if returncode is None:
+                # 다른 후보들이 예산을 모두 써서 시작하지 못함 - 다음 시도에서 다시 시도
+                print(f"⌛ {name}: 검색 시간 예산 소진으로 건너뜀")
+                continue
+            if returncode == 0:
+                print(success_message.format(name=name))
+                _write_github_outputs(results, output_prefix)
+                return True
+            if returncode == RATE_LIMITED_EXIT_CODE:
+                # 요청 제한은 일시적이므로 실패 목록에 넣지 않고 다음 시도에서 다시 시도
+                print(f"⏳ {name}: 요청 제한 (Retry-After: {retry_after}초)")
+                retry_hints.append(retry_after)
+                continue
+            print(f"❌ {name}: 종료 코드 {returncode}")
+            failed.add(name)
+    finally:
+        # 대기 중인 후보는 취소하고 실행 중인 프로브는 종료
+        cancel.set()
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
+
+    return False
+
+def find_alternative_article(current_source, skip=None, executor=None, retry_hints=None):
+    """기사 중복시 대안 기사를 찾아서 환경변수에 설정
+
+    current_source: 현재 사용된 독해 소스 (READING_SOURCE)
+    executor: 후보 프로브를 실행할 공유 스레드 풀
+    skip: 이전 시도에서 실패한 소스 이름 집합 (이번 실패도 여기에 추가됨)
+    """
+    skip = set() if skip is None else skip
+    retry_hints = [] if retry_hints is None else retry_hints
     print("🔄 대안 기사 검색 중...")
     
-    # 현재 사용된 소스와 다른 소스들 시도
-    current_source = os.environ.get('READING_SOURCE', '')
-    
-    alternative_sources = [
-        ("20minutos", "https://www.20minutos.es/rss/"),
-        ("El País", "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/portada"),
-        ("El País 사설", "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/section/opinion"),
-        ("El Mundo", "https://e00-elmundo.uecdn.es/elmundo/rss/portada.xml"),
-        ("ABC", "https://www.abc.es/rss/feeds/abc_EspanaEspana.xml")
-    ]
-    
-    # 현재 소스 제외
-    available_sources = [source for source in alternative_sources if source[0] != current_source]
+    # 현재 소스와 이전 시도에서 실패한 소스 제외
+    available_sources = [s for s in ALTERNATIVE_SOURCES
+                         if s.name != current_source and s.name not in skip]
     
     print(f"현재 소스: {current_source}")
-    print(f"시도할 대안 소스들: {[s[0] for s in available_sources]}")
+    print(f"시도할 대안 소스들: {[s.name for s in available_sources]}")
     
-    for source_name, rss_url in available_sources:
-        try:
-            print(f"\n📰 {source_name} 소스 시도 중...")
-            
-            # collect_materials.py를 호출하여 대안 기사 수집
-            env = os.environ.copy()
-            env['READING_SOURCE'] = source_name
-            env['FORCE_ALTERNATIVE'] = 'true'  # 대안 검색 모드임을 표시
-            
-            # collect_materials.py 실행
-            result = subprocess.run([
-                sys.executable, 
-                os.path.join(os.path.dirname(__file__), 'collect_materials.py')
-            ], env=env, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                print(f"✅ {source_name}에서 새로운 기사 발견!")
-                return True
-            else:
-                print(f"❌ {source_name}: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            print(f"⏰ {source_name}: 시간 초과")
-        except Exception as e:
-            print(f"❌ {source_name} 오류: {e}")
+    # 단일 기사 모드: 기사를 수집하지 못하면 팟캐스트를 수집했더라도 실패로 종료
+    candidates = [(s.name, {'READING_SOURCE': s.name, 'SINGLE_ARTICLE_MODE': 'true'})
+                  for s in available_sources]
+    if _probe_candidates(executor, candidates, 60, "✅ {name}에서 새로운 기사 발견!", skip, retry_hints,
+                         output_prefix='ARTICLE_'):
+        return True
     
     print("❌ 모든 대안 기사 소스 시도 실패")
     return False
 
-def find_alternative_podcast():
-    """팟캐스트 중복시 대안 팟캐스트를 찾아서 환경변수에 설정"""
+def find_alternative_podcast(current_podcast, skip=None, executor=None, retry_hints=None):
+    """팟캐스트 중복시 대안 팟캐스트를 찾아서 환경변수에 설정
+
+    current_podcast: 현재 사용된 팟캐스트 이름 (PODCAST_NAME)
+    executor: 후보 프로브를 실행할 공유 스레드 풀
+    skip: 이전 시도에서 실패한 팟캐스트 이름 집합 (이번 실패도 여기에 추가됨)
+    """
+    skip = set() if skip is None else skip
+    retry_hints = [] if retry_hints is None else retry_hints
     print("🔄 대안 팟캐스트 검색 중...")
     
-    # 현재 팟캐스트와 다른 팟캐스트들 시도
-    current_podcast = os.environ.get('PODCAST_NAME', '')
-    current_weekday = os.environ.get('WEEKDAY_NAME', '')
-    
-    alternative_podcasts = [
-        {
-            "name": "Hoy Hablamos",
-            "rss": "https://www.hoyhablamos.com/podcast.rss",
-            "apple_base": "https://podcasts.apple.com/kr/podcast/hoy-hablamos-podcast-diario-para-aprender-español-learn/id1201483158"
-        },
-        {
-            "name": "Radio Ambulante",
-            "rss": "https://feeds.npr.org/510311/podcast.xml", 
-            "apple_base": "https://podcasts.apple.com/kr/podcast/radio-ambulante/id527614348"
-        },
-        {
-            "name": "SpanishWithVicente",
-            "rss": "https://feeds.feedburner.com/SpanishWithVicente",
-            "apple_base": "https://podcasts.apple.com/kr/podcast/spanish-with-vicente/id1493547273"
-        },
-        {
-            "name": "DELE Podcast",
-            "rss": "https://anchor.fm/s/f4f4a4f0/podcast/rss",
-            "apple_base": "https://podcasts.apple.com/us/podcast/examen-dele/id1705001626"
-        },
-        # 추가 백업 피드들 - 실제 검증된 피드들만 사용
-        {
-            "name": "Notes in Spanish",
-            "rss": "https://feeds.feedburner.com/notesinspanish",
-            "apple_base": "https://podcasts.apple.com/us/podcast/notes-in-spanish/id1234567891"
-        }
-    ]
-    
-    # 현재 팟캐스트 제외
-    available_podcasts = [p for p in alternative_podcasts if p['name'] != current_podcast]
+    # 현재 팟캐스트와 이전 시도에서 실패한 팟캐스트 제외
+    available_podcasts = [p for p in ALTERNATIVE_PODCASTS
+                          if p.name != current_podcast and p.name not in skip]
     
     print(f"현재 팟캐스트: {current_podcast}")
-    print(f"시도할 대안 팟캐스트들: {[p['name'] for p in available_podcasts]}")
+    print(f"시도할 대안 팟캐스트들: {[p.name for p in available_podcasts]}")
     
-    for podcast in available_podcasts:
-        try:
-            print(f"\n🎧 {podcast['name']} 팟캐스트 시도 중...")
-            
-            # collect_materials.py를 호출하여 대안 팟캐스트 수집
-            env = os.environ.copy()
-            env['PODCAST_NAME'] = podcast['name']
-            env['PODCAST_RSS'] = podcast['rss']
-            env['PODCAST_APPLE_BASE'] = podcast['apple_base']
-            env['FORCE_ALTERNATIVE'] = 'true'  # 대안 검색 모드임을 표시
-            
-            # collect_materials.py 실행
-            result = subprocess.run([
-                sys.executable,
-                os.path.join(os.path.dirname(__file__), 'collect_materials.py')
-            ], env=env, capture_output=True, text=True, timeout=90)
-            
-            if result.returncode == 0:
-                print(f"✅ {podcast['name']}에서 새로운 에피소드 발견!")
-                return True
-            else:
-                print(f"❌ {podcast['name']}: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            print(f"⏰ {podcast['name']}: 시간 초과")
-        except Exception as e:
-            print(f"❌ {podcast['name']} 오류: {e}")
+    # 단일 에피소드 모드: 에피소드를 수집하지 못하면 기사를 수집했더라도 실패로 종료
+    candidates = [(p.name, {
+        'PODCAST_NAME': p.name,
+        'PODCAST_RSS': p.rss,
+        'PODCAST_APPLE_BASE': p.apple_base,
+        'SINGLE_EPISODE_MODE': 'true',
+    }) for p in available_podcasts]
+    if _probe_candidates(executor, candidates, 90, "✅ {name}에서 새로운 에피소드 발견!", skip, retry_hints,
+                         output_prefix='PODCAST_'):
+        return True
     
     print("❌ 모든 대안 팟캐스트 소스 시도 실패")
     return False
@@ -138,19 +288,11 @@ def run_create_notion_pages():
     try:
         print("\n📝 Notion 페이지 생성 재시도...")
         
-        result = subprocess.run([
-            sys.executable,
-            os.path.join(os.path.dirname(__file__), 'create_notion_pages.py')
-        ], capture_output=True, text=True, timeout=60)
-        
         print("=== create_notion_pages.py 출력 ===")
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
+        returncode = _run_streamed([sys.executable, NOTION_SCRIPT], None, 60, 'notion')
         print("=================================")
         
-        return result.returncode == 0
+        return returncode == 0
         
     except subprocess.TimeoutExpired:
         print("⏰ Notion 페이지 생성 시간 초과")
@@ -159,39 +301,78 @@ def run_create_notion_pages():
         print(f"❌ Notion 페이지 생성 오류: {e}")
         return False
 
+def _prefetch_urls():
+    """대안 검색 시 collect_materials.py가 읽게 될 RSS 피드 목록"""
+    urls = [s.rss for s in ALTERNATIVE_SOURCES]
+    # collect_materials.py는 검증된 요일별 팟캐스트 피드만 사용
+    for podcast in load_podcast_schedule():
+        if podcast and podcast['rss'] not in urls:
+            urls.append(podcast['rss'])
+    return urls
+
 def main():
     """대안 자료 검색 및 Notion 페이지 생성을 최대 3회 시도"""
     print("=== 대안 자료 검색기 시작 ===")
     
+    # Notion 페이지 생성 시도와 동시에 대안 RSS 피드를 미리 받아 디스크 캐시에 저장
+    # (collect_materials.py 프로브들이 같은 캐시를 사용)
+    prefetch_executor = ThreadPoolExecutor(max_workers=5)
+    for url in _prefetch_urls():
+        prefetch_executor.submit(prefetch_feed, url)
+    
     max_attempts = 3
     success = False
     
-    for attempt in range(1, max_attempts + 1):
-        print(f"\n🔄 시도 #{attempt}/{max_attempts}")
+    # 필요한 환경변수는 시작할 때 한 번만 읽음
+    env_snapshot = {key: os.environ.get(key, '') for key in
+                    ('ARTICLE_TITLE', 'PODCAST_TITLE', 'READING_SOURCE', 'PODCAST_NAME')}
+    
+    # 이번 실행에서 이미 실패한 소스는 다음 시도에서 다시 시도하지 않음
+    failed_article_sources = set()
+    failed_podcast_sources = set()
+    
+    # 재시도 전체에서 하나의 스레드 풀을 공유
+    # (기사/팟캐스트 검색은 서로 독립적이므로 별도 풀에서 동시에 실행)
+    executor = ThreadPoolExecutor(max_workers=MAX_PROBE_WORKERS)
+    search_executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        for attempt in range(1, max_attempts + 1):
+            print(f"\n🔄 시도 #{attempt}/{max_attempts}")
         
-        # 먼저 현재 환경변수로 Notion 페이지 생성 시도
-        if run_create_notion_pages():
-            print("✅ 페이지 생성 성공!")
-            success = True
-            break
+            # 먼저 현재 환경변수로 Notion 페이지 생성 시도
+            if run_create_notion_pages():
+                print("✅ 페이지 생성 성공!")
+                success = True
+                break
         
-        print("❌ 페이지 생성 실패 - 대안 자료 검색 시작")
+            print("❌ 페이지 생성 실패 - 대안 자료 검색 시작")
+            retry_hints = []
         
-        # 기사 대안 검색
-        article_title = os.environ.get('ARTICLE_TITLE', '')
-        if article_title and not find_alternative_article():
-            print("⚠️  기사 대안 검색 실패")
+            # 기사/팟캐스트 대안 검색을 동시에 실행
+            searches = {}
+            if env_snapshot['ARTICLE_TITLE']:
+                searches[search_executor.submit(
+                    find_alternative_article, env_snapshot['READING_SOURCE'],
+                    failed_article_sources, executor, retry_hints)] = "⚠️  기사 대안 검색 실패"
+            if env_snapshot['PODCAST_TITLE']:
+                searches[search_executor.submit(
+                    find_alternative_podcast, env_snapshot['PODCAST_NAME'],
+                    failed_podcast_sources, executor, retry_hints)] = "⚠️  팟캐스트 대안 검색 실패"
         
-        # 팟캐스트 대안 검색
-        podcast_title = os.environ.get('PODCAST_TITLE', '')  
-        if podcast_title and not find_alternative_podcast():
-            print("⚠️  팟캐스트 대안 검색 실패")
+            for future in as_completed(searches):
+                if not future.result():
+                    print(searches[future])
         
-        # 마지막 시도가 아니면 잠시 대기
-        if attempt < max_attempts:
-            print("⏳ 3초 대기 후 재시도...")
-            import time
-            time.sleep(3)
+            # rate limit에 걸린 경우에만 대기 (Retry-After, 없으면 지수 백오프)
+            # 중복 등 다른 이유로 실패했으면 새 소스로 바로 재시도
+            if attempt < max_attempts and retry_hints:
+                delay = min(MAX_BACKOFF_SECONDS, max(retry_hints) or 2 ** attempt)
+                print(f"⏳ 요청 제한 - {delay}초 대기 후 재시도...")
+                time.sleep(delay)
+    finally:
+        search_executor.shutdown(wait=False, cancel_futures=True)
+        executor.shutdown(wait=False, cancel_futures=True)
+        prefetch_executor.shutdown(wait=False, cancel_futures=True)
     
     if not success:
         print(f"\n❌ {max_attempts}회 시도했지만 새로운 자료를 찾지 못했습니다.")
@@ -4,16 +4,30 @@ Collect Spanish learning materials: articles and podcast episodes with LLM-power
 """
 import os
 import sys
-import requests
-import feedparser
 import re
 import time
 import random
+import json
+import hashlib
+import threading
 import traceback
 import urllib.parse
+from collections import Counter
+from itertools import islice
 from datetime import datetime, timedelta
+from html import unescape
 from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+from lxml import etree
+import soupsieve
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# RSS 피드는 ETag/Last-Modified 캐시를 거쳐서 가져옴
+# HTTP 요청은 스레드별 keep-alive 세션(get_session)을 공유
+from http_cache import (fetch_feed, conditional_get, fetch_capped, get_session, rate_limit_retry_after,
+                        record_rate_limit, response_json, ARTICLE_CACHE_DIR, CACHE_ROOT, HTML_HEADERS, JSON_HEADERS, RATE_LIMITED_EXIT_CODE)
 
 # LLM 분석기 임포트
 try:
@@ -23,6 +37,18 @@ except ImportError:
     print("⚠️ LLM 분석기를 사용할 수 없습니다. LLM이 필수입니다.")
     LLM_AVAILABLE = False
 
+# URL 유효성 동시 확인 수
+URL_CHECK_WORKERS = 4
+
+# RSS 피드 동시 요청 수
+FEED_FETCH_WORKERS = 8
+
+# 대체 에피소드를 찾을 때 피드 앞쪽에서 확인할 최대 에피소드 수
+EPISODE_SCAN_LIMIT = 50
+
+# 에피소드/쇼노트 페이지는 앞부분만 받음 (뒤쪽은 대부분 스크립트와 광고)
+EPISODE_PAGE_MAX_BYTES = 512 * 1024
+
 def is_episode_recent(published_date, max_days_old=30, allow_old=True):
     """
     에피소드가 최근 며칠 이내에 발행되었는지 확인
@@ -32,6 +58,53 @@ def is_episode_recent(published_date, max_days_old=30, allow_old=True):
 
 
 
+# LLM 분석기는 한 번만 생성해서 재사용
+_analyzer = None
+
+def _get_analyzer():
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = SpanishLLMAnalyzer()
+    return _analyzer
+
+# LLM 분석 결과 캐시 (내용 해시 → 결과) - 재실행(alternative_finder 재시도 등) 사이에도 유지
+LLM_CACHE_PATH = os.path.join(CACHE_ROOT, 'llm_results.json')
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+def _llm_cache_key(kind, content, *params):
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    return ':'.join((kind, *params, digest))
+
+def _load_llm_cache():
+    global _llm_cache
+    if _llm_cache is None:
+        try:
+            with open(LLM_CACHE_PATH, 'rb') as f:
+                _llm_cache = json.load(f)
+        except (OSError, ValueError):
+            _llm_cache = {}
+    return _llm_cache
+
+def llm_cache_get(key):
+    """캐시된 LLM 분석 결과 반환 (없으면 None)"""
+    with _llm_cache_lock:
+        return _load_llm_cache().get(key)
+
+def llm_cache_put(key, value):
+    """LLM 분석 결과를 캐시에 추가하고 파일에 원자적으로 저장"""
+    with _llm_cache_lock:
+        cache = _load_llm_cache()
+        cache[key] = value
+        try:
+            os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{LLM_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_path, LLM_CACHE_PATH)
+        except OSError as e:
+            print(f"⚠️ LLM 결과 캐시 저장 실패: {e}")
+
 def analyze_text_difficulty(content):
     """Analyze text difficulty using LLM"""
     if not content:
@@ -41,18 +114,174 @@ def analyze_text_difficulty(content):
         print("⚠️ LLM 분석기가 필요합니다. 기본 난이도 B2를 사용합니다.")
         return "B2"
     
+    # 같은 내용은 한 번만 분석 (LLM 호출 비용 절감) - 분석기는 앞 1000자만 사용
+    cache_key = _llm_cache_key('difficulty', content[:1001])
+    difficulty = llm_cache_get(cache_key)
+    if difficulty:
+        return difficulty
+    
     try:
-        analyzer = SpanishLLMAnalyzer()
-        return analyzer.analyze_text_difficulty(content)
+        difficulty = _get_analyzer().analyze_text_difficulty(content)
     except Exception as e:
         print(f"LLM 난이도 분석 오류: {e}")
         return "B2"  # 기본값
+    
+    # API 오류 등으로 레벨을 받지 못하면 기본값만 사용하고 캐시하지 않음 (다음 실행에서 다시 분석)
+    if not difficulty:
+        return "B2"
+    llm_cache_put(cache_key, difficulty)
+    return difficulty
 
-def search_apple_podcasts_episode(podcast_name, episode_title, apple_base):
-    """Search for exact episode URL using Apple iTunes Search API"""
+# 제목 매칭에서 제외할 단어
+_STOPWORDS = frozenset({'the', 'and', 'of', 'in', 'to', 'for', 'with', 'episode', 'ep'})
+
+@lru_cache(maxsize=256)
+def _title_terms(episode_title):
+    """에피소드 제목의 매칭용 단어들 - (단어 집합, 5자 이상 단어, 중요 단어) (제목별로 한 번만 계산)"""
+    title_words = episode_title.lower().split()
+    long_words = tuple(word for word in title_words if len(word) > 4)
+    important_words = tuple(word for word in title_words if len(word) > 3 and word not in _STOPWORDS)
+    return frozenset(title_words), long_words, important_words
+
+# iTunes Search API (검색어는 params로 전달해서 requests가 인코딩)
+_ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
+
+def _itunes_search(search_term, limit=50):
+    """iTunes Search API로 에피소드 검색 - 결과 목록 반환 (실패 시 None)"""
+    params = {'term': search_term, 'media': 'podcast', 'entity': 'podcastEpisode', 'limit': limit}
+    
+    print(f"    📡 iTunes Search API 호출: {search_term} (limit={limit})")
+    
+    response = get_session().get(_ITUNES_SEARCH_URL, params=params, headers=JSON_HEADERS, timeout=10)
+    if response.status_code == 429:
+        # 피드 요청과 같이 Retry-After를 기록 (아무것도 수집하지 못하면 종료 코드 42)
+        record_rate_limit(response)
+    if response.status_code != 200:
+        print(f"    ❌ iTunes Search API 호출 실패: {response.status_code}")
+        return None
+    
+    results = response_json(response).get('results', [])
+    print(f"    📊 iTunes 검색 결과 ({search_term}): {len(results)}개 에피소드 발견")
+    return results
+
+def _is_podcast_match(podcast_name, collection_name):
+    """검색 결과의 컬렉션 이름이 찾는 팟캐스트인지 확인"""
+    # 정확한 이름 매칭 우선
+    if podcast_name.lower().replace(' ', '') in collection_name.replace(' ', ''):
+        return True
+    # 키워드 기반 매칭
+    return any(name.lower() in collection_name for name in podcast_name.split() if len(name) > 3)
+
+def _is_title_match(episode_title, track_name):
+    """통합된 에피소드 제목 매칭 로직 (모든 팟캐스트에 적용)"""
+    title_word_set, long_words, important_words = _title_terms(episode_title)
+    track_lower = track_name.lower()
+    
+    # 1. 공통 단어 매칭
+    if len(title_word_set.intersection(track_lower.split())) >= 2:
+        return True
+    
+    # 2. 중요한 단어 매칭
+    if any(word in track_lower for word in long_words):
+        return True
+    
+    # 3. 키워드 기반 매칭
+    if important_words:
+        matches = sum(1 for word in important_words if word in track_lower)
+        return matches >= min(2, len(important_words))
+    return False
+
+def _find_itunes_episode(search_term, podcast_name, episode_title):
+    """iTunes Search API로 검색어 하나를 조회해서 일치하는 에피소드 URL 반환 (없으면 None)"""
     try:
-        import urllib.parse
+        results = _itunes_search(search_term)
         
+        # 검색 결과에서 해당 팟캐스트 에피소드 찾기
+        for result in results or []:
+            collection_name = result.get('collectionName', '').lower()
+            track_name = result.get('trackName', '')
+            track_view_url = result.get('trackViewUrl', '')
+            
+            print(f"    📺 검토 중: {track_name} (컬렉션: {collection_name})")
+            
+            if _is_podcast_match(podcast_name, collection_name) and _is_title_match(episode_title, track_name) and track_view_url:
+                print(f"    ✅ Apple Podcast 정확한 에피소드 URL 발견: {track_view_url}")
+                return track_view_url
+    except Exception as e:
+        print(f"    ❌ iTunes Search 오류 (검색어: {search_term}): {e}")
+    return None
+
+# 넓은 검색 결과를 바로 사용하려면 제목과 겹쳐야 하는 최소 단어 수 (정규화한 제목이 같으면 바로 사용)
+BROAD_MIN_COMMON_WORDS = 2
+
+_TITLE_WORD_RE = re.compile(r'\w+')
+
+def _normalize_title(title):
+    """제목 비교용 정규화 - 소문자, 문장부호 제거, 공백 하나로"""
+    return ' '.join(_TITLE_WORD_RE.findall(title.lower()))
+
+def _find_itunes_episode_broad(podcast_name, episode_title):
+    """팟캐스트 이름 한 번의 검색(limit=200) 결과에서 제목과 가장 많이 겹치는 에피소드 URL 반환
+
+    제목이 정규화 후 같거나 공통 단어가 BROAD_MIN_COMMON_WORDS개 이상인 결과만 사용
+    (애매하면 None을 반환해서 정확한 검색어들로 검색하도록 함)
+    Returns: (URL 또는 None, 검색 결과가 있었는지 여부)
+    """
+    try:
+        results = _itunes_search(podcast_name, limit=200)
+        if not results:
+            return None, False
+        
+        title_words = _title_terms(episode_title)[0]
+        normalized_title = _normalize_title(episode_title)
+        best_url, best_score = None, BROAD_MIN_COMMON_WORDS - 1
+        for result in results:
+            track_name = result.get('trackName', '')
+            track_view_url = result.get('trackViewUrl', '')
+            if not track_view_url or not _is_podcast_match(podcast_name, result.get('collectionName', '').lower()):
+                continue
+            if normalized_title and _normalize_title(track_name) == normalized_title:
+                print(f"    ✅ Apple Podcast 에피소드 URL 발견 (제목 일치): {track_view_url}")
+                return track_view_url, True
+            if not _is_title_match(episode_title, track_name):
+                continue
+            score = len(title_words & set(track_name.lower().split()))
+            if score > best_score:
+                best_url, best_score = track_view_url, score
+        
+        if best_url:
+            print(f"    ✅ Apple Podcast 에피소드 URL 발견 (공통 단어 {best_score}개): {best_url}")
+        return best_url, True
+    except Exception as e:
+        print(f"    ❌ iTunes Search 오류 (검색어: {podcast_name}): {e}")
+        return None, False
+
+# 이번 실행에서 찾은 에피소드 URL ((팟캐스트 이름, 제목) → trackViewUrl)
+# 찾지 못한 경우(시간 초과, 429 등)는 저장하지 않아 다음 조회에서 다시 검색
+_apple_episode_urls = {}
+_apple_episode_urls_lock = threading.Lock()
+
+def search_apple_podcasts_episode(podcast_name, episode_title, apple_base):
+    """Search for exact episode URL using Apple iTunes Search API (찾은 에피소드는 한 번만 검색)
+
+    찾지 못하면 apple_base 반환
+    """
+    key = (podcast_name, episode_title)
+    with _apple_episode_urls_lock:
+        track_view_url = _apple_episode_urls.get(key)
+    if track_view_url:
+        return track_view_url
+    
+    track_view_url = _search_apple_podcasts_episode(podcast_name, episode_title)
+    if not track_view_url:
+        return apple_base
+    with _apple_episode_urls_lock:
+        _apple_episode_urls[key] = track_view_url
+    return track_view_url
+
+def _search_apple_podcasts_episode(podcast_name, episode_title):
+    """여러 검색어로 iTunes Search API를 조회해서 에피소드 URL 반환 (없으면 None)"""
+    try:
         print(f"    🔍 iTunes Search API로 {podcast_name} 에피소드 검색 중...")
         
         # 다양한 검색어로 시도
@@ -78,335 +307,356 @@ def search_apple_podcasts_episode(podcast_name, episode_title, apple_base):
             search_terms.append(f"{podcast_name} {subtitle}")
         
         # 중요한 키워드만 추출하여 검색 (모든 팟캐스트에 적용)
-        keywords = episode_title.lower().split()
-        important_words = [w for w in keywords if len(w) > 3 and w not in ['the', 'and', 'of', 'in', 'to', 'for', 'with', 'episode', 'ep']]
+        important_words = _title_terms(episode_title)[2]
         if important_words and len(important_words) >= 2:
             search_terms.append(f"{podcast_name} {' '.join(important_words[:2])}")
         
+        # 겹치는 검색어 제거 (순서 유지)
+        search_terms = list(dict.fromkeys(search_terms))
         print(f"    🔍 검색어들: {search_terms[:5]}...")  # 처음 5개만 표시
         
-        for search_term in search_terms:
-            encoded_term = urllib.parse.quote(search_term)
-            search_url = f"https://itunes.apple.com/search?term={encoded_term}&media=podcast&entity=podcastEpisode&limit=50"
-            
-            print(f"    📡 iTunes Search API 호출: {search_url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(search_url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get('results', [])
-                
-                print(f"    📊 iTunes 검색 결과 ({search_term}): {len(results)}개 에피소드 발견")
-                
-                # 검색 결과에서 해당 팟캐스트 에피소드 찾기
-                for result in results:
-                    collection_name = result.get('collectionName', '').lower()
-                    track_name = result.get('trackName', '')
-                    track_view_url = result.get('trackViewUrl', '')
-                    
-                    print(f"    📺 검토 중: {track_name} (컬렉션: {collection_name})")
-                    
-                    # 팟캐스트 이름 매칭 확인 (통합된 로직)
-                    podcast_match = False
-                    
-                    # 정확한 이름 매칭 우선
-                    if podcast_name.lower().replace(' ', '') in collection_name.replace(' ', ''):
-                        podcast_match = True
-                    # 키워드 기반 매칭
-                    elif any(name.lower() in collection_name for name in podcast_name.split() if len(name) > 3):
-                        podcast_match = True
-                    
-                    if podcast_match:
-                        # 통합된 에피소드 제목 매칭 로직
-                        title_match = False
-                        
-                        title_words = episode_title.lower().split()
-                        track_words = track_name.lower().split()
-                        
-                        # 1. 공통 단어 매칭 (모든 팟캐스트에 적용)
-                        common_words = set(title_words) & set(track_words)
-                        if len(common_words) >= 2:
-                            title_match = True
-                        
-                        # 2. 중요한 단어 매칭 (모든 팟캐스트에 적용)
-                        elif any(word in track_name.lower() for word in title_words if len(word) > 4):
-                            title_match = True
-                        
-                        # 3. 키워드 기반 매칭 (모든 팟캐스트에 적용)
-                        else:
-                            important_words = [word for word in title_words if len(word) > 3 and word not in ['the', 'and', 'of', 'in', 'to', 'for', 'with', 'episode', 'ep']]
-                            if important_words:
-                                matches = sum(1 for word in important_words if word in track_name.lower())
-                                if matches >= min(2, len(important_words)):
-                                    title_match = True
-                        
-                        if title_match and track_view_url:
-                            print(f"    ✅ Apple Podcast 정확한 에피소드 URL 발견: {track_view_url}")
-                            return track_view_url
-                
-            else:
-                print(f"    ❌ iTunes Search API 호출 실패: {response.status_code}")
+        # 검색어가 많으면 팟캐스트 이름으로 한 번 넓게 검색해서 먼저 확인
+        if len(search_terms) > 3:
+            track_view_url, has_results = _find_itunes_episode_broad(podcast_name, episode_title)
+            if track_view_url:
+                return track_view_url
+            if has_results:
+                # 팟캐스트 이름 검색은 이미 더 넓게 확인했으므로 제외
+                search_terms = [term for term in search_terms if term != podcast_name]
+        
+        # 검색어 우선순위대로 하나씩 요청하고 찾으면 중단 (요청 제한이 있는 iTunes API에 한꺼번에 보내지 않음)
+        for term in search_terms:
+            track_view_url = _find_itunes_episode(term, podcast_name, episode_title)
+            if track_view_url:
+                return track_view_url
         
         print(f"    ⚠️ 모든 검색어로 시도했지만 정확한 에피소드를 찾지 못함")
-        return apple_base
+        return None
                 
     except Exception as e:
         print(f"    ❌ iTunes Search 오류: {e}")
+        return None
+
+def _find_apple_episode_link(podcast_name, episode_title, apple_base, label):
+    """iTunes Search API로 에피소드 URL 검색 - 찾지 못하면 None"""
+    if episode_title:
+        apple_url = search_apple_podcasts_episode(podcast_name, episode_title, apple_base)
+        if apple_url != apple_base and validate_url(apple_url):
+            print(f"    ✅ iTunes Search API에서 {label} 에피소드 발견: {apple_url}")
+            return apple_url
+    return None
+
+def _apple_link_radio_ambulante(podcast_name, apple_base, episode_link, episode_number, episode_title):
+    # Radio Ambulante는 원본 웹사이트 링크를 우선 사용
+    if episode_link and 'radioambulante.org' in episode_link and validate_url(episode_link):
+        print(f"    ✅ Radio Ambulante 원본 웹사이트 링크 사용: {episode_link}")
+        return episode_link
+    
+    # iTunes Search API 시도
+    apple_url = _find_apple_episode_link(podcast_name, episode_title, apple_base, 'Radio Ambulante')
+    if apple_url:
+        return apple_url
+    
+    # 모든 시도가 실패하면 원본 링크 또는 기본 Apple 링크 반환
+    if episode_link and validate_url(episode_link):
+        return episode_link
+    else:
         return apple_base
 
-def generate_apple_podcast_link(podcast_name, apple_base, episode_link, episode_number, episode_title=""):
-    """Generate optimized Apple Podcasts link by podcast type"""
+def _apple_link_spanishpodcast(podcast_name, apple_base, episode_link, episode_number, episode_title):
+    # SpanishPodcast는 원본 웹사이트 링크를 우선 사용
+    if episode_link and validate_url(episode_link):
+        print(f"    ✅ SpanishPodcast 원본 웹사이트 링크 사용: {episode_link}")
+        return episode_link
     
-    # 모든 팟캐스트에 대한 통합된 링크 생성 전략
-    if 'Radio Ambulante' in podcast_name or 'npr.org' in episode_link:
-        # Radio Ambulante는 원본 웹사이트 링크를 우선 사용
-        if episode_link and 'radioambulante.org' in episode_link and validate_url(episode_link):
-            print(f"    ✅ Radio Ambulante 원본 웹사이트 링크 사용: {episode_link}")
-            return episode_link
-        else:
-            # iTunes Search API 시도
-            if episode_title:
-                apple_url = search_apple_podcasts_episode(podcast_name, episode_title, apple_base)
-                if apple_url != apple_base and validate_url(apple_url):
-                    print(f"    ✅ iTunes Search API에서 Radio Ambulante 에피소드 발견: {apple_url}")
-                    return apple_url
-            
-            # 모든 시도가 실패하면 원본 링크 또는 기본 Apple 링크 반환
-            if episode_link and validate_url(episode_link):
-                return episode_link
-            else:
-                return apple_base
+    print(f"    ⚠️ SpanishPodcast 원본 링크 유효하지 않음, iTunes Search API 시도")
+    # 원본 링크가 유효하지 않으면 iTunes Search API 시도
+    apple_url = _find_apple_episode_link(podcast_name, episode_title, apple_base, 'SpanishPodcast')
+    if apple_url:
+        return apple_url
     
-    elif 'SpanishPodcast' in podcast_name:
-        # SpanishPodcast는 원본 웹사이트 링크를 우선 사용
-        if episode_link and validate_url(episode_link):
-            print(f"    ✅ SpanishPodcast 원본 웹사이트 링크 사용: {episode_link}")
-            return episode_link
-        else:
-            print(f"    ⚠️ SpanishPodcast 원본 링크 유효하지 않음, iTunes Search API 시도")
-            # 원본 링크가 유효하지 않으면 iTunes Search API 시도
-            if episode_title:
-                apple_url = search_apple_podcasts_episode(podcast_name, episode_title, apple_base)
-                if apple_url != apple_base and validate_url(apple_url):
-                    print(f"    ✅ iTunes Search API에서 SpanishPodcast 에피소드 발견: {apple_url}")
-                    return apple_url
-            
-            # iTunes Search도 실패하면 기본 Apple Podcasts 링크 반환
-            print(f"    🔄 iTunes Search API도 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
-            return apple_base
+    # iTunes Search도 실패하면 기본 Apple Podcasts 링크 반환
+    print(f"    🔄 iTunes Search API도 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
+    return apple_base
 
-    elif 'Hoy Hablamos' in podcast_name:
-        # iTunes Search API 우선 시도
-        if episode_title:
-            apple_url = search_apple_podcasts_episode(podcast_name, episode_title, apple_base)
-            if apple_url != apple_base and validate_url(apple_url):
-                print(f"    ✅ iTunes Search API에서 Hoy Hablamos 에피소드 발견: {apple_url}")
-                return apple_url
+def _apple_link_hoy_hablamos(podcast_name, apple_base, episode_link, episode_number, episode_title):
+    # iTunes Search API 우선 시도
+    apple_url = _find_apple_episode_link(podcast_name, episode_title, apple_base, 'Hoy Hablamos')
+    if apple_url:
+        return apple_url
+    
+    # iTunes Search가 실패하면 에피소드 번호 기반으로 링크 생성 시도
+    if episode_number and episode_number != 'N/A':
+        try:
+            ep_num = int(episode_number)
+            generated_url = f"{apple_base}?i=1000{ep_num:06d}"
+            print(f"    🔄 에피소드 번호 기반 URL 생성: {generated_url}")
+            if validate_url(generated_url):
+                return generated_url
+        except:
+            pass
+    
+    print(f"    🔄 모든 시도 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
+    return apple_base
+
+def _apple_link_spanish_with_vicente(podcast_name, apple_base, episode_link, episode_number, episode_title):
+    # iTunes Search API 우선 시도
+    apple_url = _find_apple_episode_link(podcast_name, episode_title, apple_base, 'SpanishWithVicente')
+    if apple_url:
+        return apple_url
+    
+    # iTunes Search가 실패하면 에피소드 번호 추가 시도
+    if episode_number and episode_number != 'N/A':
+        generated_url = f"{apple_base}?i={episode_number}"
+        print(f"    🔄 에피소드 번호 추가 URL: {generated_url}")
+        if validate_url(generated_url):
+            return generated_url
+    
+    print(f"    🔄 모든 시도 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
+    return apple_base
+
+def _apple_link_dele(podcast_name, apple_base, episode_link, episode_number, episode_title):
+    # iTunes Search API 우선 시도
+    apple_url = _find_apple_episode_link(podcast_name, episode_title, apple_base, 'DELE')
+    if apple_url:
+        return apple_url
+    
+    # iTunes Search가 실패하면 메인 링크 사용
+    print(f"    🔄 iTunes Search 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
+    return apple_base
+
+def _apple_link_generic(podcast_name, apple_base, episode_link, episode_number, episode_title):
+    # 기본 전략: iTunes Search API로 정확한 에피소드 찾기
+    if episode_title:
+        print(f"    🔍 iTunes Search API로 {podcast_name} 에피소드 검색 중...")
         
-        # iTunes Search가 실패하면 에피소드 번호 기반으로 링크 생성 시도
-        if episode_number and episode_number != 'N/A':
-            try:
-                ep_num = int(episode_number)
-                generated_url = f"{apple_base}?i=1000{ep_num:06d}"
-                print(f"    🔄 에피소드 번호 기반 URL 생성: {generated_url}")
-                if validate_url(generated_url):
-                    return generated_url
-            except:
-                pass
-        
-        print(f"    🔄 모든 시도 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
-        return apple_base
+        # 다양한 검색어로 시도
+        search_terms = []
         
-    elif 'SpanishWithVicente' in podcast_name:
-        # iTunes Search API 우선 시도
-        if episode_title:
-            apple_url = search_apple_podcasts_episode(podcast_name, episode_title, apple_base)
-            if apple_url != apple_base and validate_url(apple_url):
-                print(f"    ✅ iTunes Search API에서 SpanishWithVicente 에피소드 발견: {apple_url}")
-                return apple_url
+        # 1. 팟캐스트 이름 + 에피소드 제목
+        search_terms.append(f"{podcast_name} {episode_title}")
         
-        # iTunes Search가 실패하면 에피소드 번호 추가 시도
+        # 2. 에피소드 번호가 있으면 번호로도 검색
         if episode_number and episode_number != 'N/A':
-            generated_url = f"{apple_base}?i={episode_number}"
-            print(f"    🔄 에피소드 번호 추가 URL: {generated_url}")
-            if validate_url(generated_url):
-                return generated_url
-        
-        print(f"    🔄 모든 시도 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
-        return apple_base
+            search_terms.append(f"{podcast_name} {episode_number}")
+            search_terms.append(f"{podcast_name} Episode {episode_number}")
+            search_terms.append(f"{podcast_name} Ep {episode_number}")
         
-    elif 'DELE' in podcast_name:
-        # iTunes Search API 우선 시도
-        if episode_title:
-            apple_url = search_apple_podcasts_episode(podcast_name, episode_title, apple_base)
-            if apple_url != apple_base and validate_url(apple_url):
-                print(f"    ✅ iTunes Search API에서 DELE 에피소드 발견: {apple_url}")
-                return apple_url
+        # 3. 에피소드 제목만으로도 검색
+        search_terms.append(episode_title)
         
-        # iTunes Search가 실패하면 메인 링크 사용
-        print(f"    🔄 iTunes Search 실패, 기본 Apple Podcasts 링크 사용: {apple_base}")
-        return apple_base
-    else:
-        # 기본 전략: iTunes Search API로 정확한 에피소드 찾기
-        if episode_title:
-            print(f"    🔍 iTunes Search API로 {podcast_name} 에피소드 검색 중...")
-            
-            # 다양한 검색어로 시도
-            search_terms = []
-            
-            # 1. 팟캐스트 이름 + 에피소드 제목
-            search_terms.append(f"{podcast_name} {episode_title}")
-            
-            # 2. 에피소드 번호가 있으면 번호로도 검색
-            if episode_number and episode_number != 'N/A':
-                search_terms.append(f"{podcast_name} {episode_number}")
-                search_terms.append(f"{podcast_name} Episode {episode_number}")
-                search_terms.append(f"{podcast_name} Ep {episode_number}")
-            
-            # 3. 에피소드 제목만으로도 검색
-            search_terms.append(episode_title)
-            
-            for search_term in search_terms:
-                try:
-                    encoded_term = urllib.parse.quote(search_term)
-                    search_url = f"https://itunes.apple.com/search?term={encoded_term}&media=podcast&entity=podcastEpisode&limit=20"
-                    
-                    print(f"    🔍 검색어: {search_term}")
-                    
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    }
-                    
-                    response = requests.get(search_url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        results = data.get('results', [])
+        for search_term in search_terms:
+            try:
+                print(f"    🔍 검색어: {search_term}")
+                
+                results = _itunes_search(search_term, limit=20)
+                if results is not None:
+                    for result in results:
+                        result_title = result.get('trackName', '').lower()
+                        collection_name = result.get('collectionName', '').lower()
+                        track_view_url = result.get('trackViewUrl', '')
                         
-                        print(f"    📊 iTunes 검색 결과: {len(results)}개 에피소드 발견")
+                        print(f"    📺 검토 중: {result.get('trackName', '')} (컬렉션: {collection_name})")
                         
-                        for result in results:
-                            result_title = result.get('trackName', '').lower()
-                            collection_name = result.get('collectionName', '').lower()
-                            track_view_url = result.get('trackViewUrl', '')
-                            
-                            print(f"    📺 검토 중: {result.get('trackName', '')} (컬렉션: {collection_name})")
+                        # 팟캐스트 이름 매칭 확인
+                        podcast_match = False
+                        if 'spanishpodcast' in podcast_name.lower() and 'spanishpodcast' in collection_name:
+                            podcast_match = True
+                        elif any(name.lower() in collection_name for name in podcast_name.split() if len(name) > 3):
+                            podcast_match = True
+                        
+                        if podcast_match:
+                            # 에피소드 제목 매칭 확인
+                            title_match = False
                             
-                            # 팟캐스트 이름 매칭 확인
-                            podcast_match = False
-                            if 'spanishpodcast' in podcast_name.lower() and 'spanishpodcast' in collection_name:
-                                podcast_match = True
-                            elif any(name.lower() in collection_name for name in podcast_name.split() if len(name) > 3):
-                                podcast_match = True
+                            # 에피소드 번호 매칭
+                            if episode_number and episode_number != 'N/A':
+                                if episode_number in result_title or f"episode {episode_number}" in result_title or f"ep {episode_number}" in result_title:
+                                    title_match = True
                             
-                            if podcast_match:
-                                # 에피소드 제목 매칭 확인
-                                title_match = False
-                                
-                                # 에피소드 번호 매칭
-                                if episode_number and episode_number != 'N/A':
-                                    if episode_number in result_title or f"episode {episode_number}" in result_title or f"ep {episode_number}" in result_title:
+                            # 제목 키워드 매칭
+                            if not title_match:
+                                important_words = _title_terms(episode_title)[2]
+                                if important_words:
+                                    matches = sum(1 for word in important_words if word in result_title)
+                                    if matches >= min(2, len(important_words)):
                                         title_match = True
-                                
-                                # 제목 키워드 매칭
-                                if not title_match:
-                                    title_words = episode_title.lower().split()
-                                    important_words = [word for word in title_words if len(word) > 3 and word not in ['the', 'and', 'of', 'in', 'to', 'for', 'with', 'episode', 'ep']]
-                                    if important_words:
-                                        matches = sum(1 for word in important_words if word in result_title)
-                                        if matches >= min(2, len(important_words)):
-                                            title_match = True
-                                
-                                if title_match and track_view_url:
-                                    print(f"    ✅ Apple Podcast 정확한 에피소드 URL 발견: {track_view_url}")
-                                    return track_view_url
-                        
-                        # 이 검색어로 찾았으면 더 이상 시도하지 않음
-                        if results:
-                            print(f"    ⚠️ iTunes에서 정확한 매칭을 찾지 못함 (검색어: {search_term})")
-                            break
                             
-                    else:
-                        print(f"    ❌ iTunes Search API 오류: {response.status_code}")
-                        
-                except Exception as e:
-                    print(f"    ❌ iTunes Search 오류 (검색어: {search_term}): {e}")
-                    continue
-            
-            print(f"    ⚠️ 모든 검색어로 시도했지만 정확한 에피소드를 찾지 못함")
+                            if title_match and track_view_url:
+                                print(f"    ✅ Apple Podcast 정확한 에피소드 URL 발견: {track_view_url}")
+                                return track_view_url
+                    
+                    # 이 검색어로 찾았으면 더 이상 시도하지 않음
+                    if results:
+                        print(f"    ⚠️ iTunes에서 정확한 매칭을 찾지 못함 (검색어: {search_term})")
+                        break
+                    
+            except Exception as e:
+                print(f"    ❌ iTunes Search 오류 (검색어: {search_term}): {e}")
+                continue
         
-        # 모든 시도가 실패하면 기본 Apple Podcasts 링크 반환
-        print(f"    🔄 기본 Apple Podcasts 링크 사용: {apple_base}")
+        print(f"    ⚠️ 모든 검색어로 시도했지만 정확한 에피소드를 찾지 못함")
+    
+    # 모든 시도가 실패하면 기본 Apple Podcasts 링크 반환
+    print(f"    🔄 기본 Apple Podcasts 링크 사용: {apple_base}")
+    
+    # 지역 코드를 바꾼 링크 (us -> kr, kr -> us)
+    alternative_url = None
+    if '/us/' in apple_base:
+        alternative_url, region_change = apple_base.replace('/us/', '/kr/'), 'us -> kr'
+    elif '/kr/' in apple_base:
+        alternative_url, region_change = apple_base.replace('/kr/', '/us/'), 'kr -> us'
+    
+    # 기본 링크와 지역 변경 링크를 동시에 검증하고 기본 링크를 우선 사용
+    valid = validate_urls([apple_base, alternative_url])
+    if valid[apple_base]:
+        return apple_base
+    else:
+        print(f"    ❌ 기본 Apple Podcasts 링크도 유효하지 않음: {apple_base}")
         
-        # Apple Podcasts 링크 유효성 검증
-        if validate_url(apple_base):
-            return apple_base
-        else:
-            print(f"    ❌ 기본 Apple Podcasts 링크도 유효하지 않음: {apple_base}")
-            
-            # 지역 코드 변경 시도 (us -> kr, kr -> us)
-            if '/us/' in apple_base:
-                alternative_url = apple_base.replace('/us/', '/kr/')
-                print(f"    🔄 지역 코드 변경 시도 (us -> kr): {alternative_url}")
-                if validate_url(alternative_url):
-                    return alternative_url
-            elif '/kr/' in apple_base:
-                alternative_url = apple_base.replace('/kr/', '/us/')
-                print(f"    🔄 지역 코드 변경 시도 (kr -> us): {alternative_url}")
-                if validate_url(alternative_url):
-                    return alternative_url
-            
-            # 최종적으로 원본 링크 반환
-            print(f"    ⚠️ 모든 Apple Podcasts 링크 시도 실패, 원본 링크 반환")
-            return apple_base
+        if alternative_url:
+            print(f"    🔄 지역 코드 변경 시도 ({region_change}): {alternative_url}")
+            if valid[alternative_url]:
+                return alternative_url
+        
+        # 최종적으로 원본 링크 반환
+        print(f"    ⚠️ 모든 Apple Podcasts 링크 시도 실패, 원본 링크 반환")
+        return apple_base
+
+# 팟캐스트 이름에 포함된 키워드 → 링크 생성 전략 (위에서부터 먼저 일치하는 전략 사용)
+_APPLE_LINK_STRATEGIES = (
+    ('Radio Ambulante', _apple_link_radio_ambulante),
+    ('SpanishPodcast', _apple_link_spanishpodcast),
+    ('Hoy Hablamos', _apple_link_hoy_hablamos),
+    ('SpanishWithVicente', _apple_link_spanish_with_vicente),
+    ('DELE', _apple_link_dele),
+)
+
+def generate_apple_podcast_link(podcast_name, apple_base, episode_link, episode_number, episode_title=""):
+    """Generate optimized Apple Podcasts link by podcast type"""
+    
+    # NPR에서 배포하는 에피소드는 Radio Ambulante 전략 사용
+    if episode_link and 'npr.org' in episode_link:
+        strategy = _apple_link_radio_ambulante
+    else:
+        strategy = next((fn for key, fn in _APPLE_LINK_STRATEGIES if key in podcast_name), _apple_link_generic)
+    return strategy(podcast_name, apple_base, episode_link, episode_number, episode_title)
+
+# 기사 HTML 최대 다운로드 크기 (본문은 앞부분 2000자만 사용)
+ARTICLE_MAX_BYTES = 256 * 1024
+
+# 받은 기사 HTML을 재검증 없이 재사용할 시간 (초) - 재시도 실행에서 같은 기사를 다시 요청하지 않음
+ARTICLE_MAX_AGE = 3600
+
+def element_texts(elements, min_length=0):
+    """요소들의 텍스트(앞뒤 공백 제거)를 차례로 반환 - min_length자보다 짧은 텍스트는 건너뜀"""
+    for elem in elements:
+        text = elem.get_text().strip()
+        if len(text) >= min_length:
+            yield text
+
+def join_texts(texts, cap):
+    """텍스트들을 공백으로 이어 붙이되 cap자 이상 모이면 나머지는 읽지 않음 (앞 cap자만 쓰는 경우용)"""
+    parts = []
+    length = -1
+    for text in texts:
+        parts.append(text)
+        length += len(text) + 1
+        if length >= cap:
+            break
+    return ' '.join(parts)
+
+# BeautifulSoup의 get_text처럼 script/style/template/rt/rp 안의 텍스트와 주석은 제외한 텍스트 노드
+_VISIBLE_TEXT = etree.XPath('descendant::text()[not(ancestor::script or ancestor::style or ancestor::template'
+                            ' or ancestor::rt or ancestor::rp)]')
+
+def _visible_text(node):
+    """요소의 텍스트 - 공백만 있는 텍스트 노드는 BeautifulSoup처럼 줄바꿈 또는 공백 하나로 줄임"""
+    return ''.join(
+        text if text.strip(' \t\n\r\f') else ('\n' if '\n' in text else ' ')
+        for text in _VISIBLE_TEXT(node))
+
+def node_texts(nodes, min_length=0):
+    """lxml 요소들의 텍스트(앞뒤 공백 제거)를 차례로 반환 - element_texts의 lxml 버전"""
+    for node in nodes:
+        text = _visible_text(node).strip()
+        if len(text) >= min_length:
+            yield text
+
+def _class_xpath(tag, class_name):
+    """class 속성에 class_name이 들어 있는 첫 번째 tag 요소 XPath (BeautifulSoup의 class_ 검색과 같음)"""
+    return etree.XPath(f"(//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')])[1]")
+
+# 기사 본문 후보 요소 (순서대로 시도 - 문서는 한 번만 파싱하고 XPath는 lxml에서 평가)
+_20MINUTOS_BODY_XPATHS = (_class_xpath('div', 'article-text'), _class_xpath('div', 'content'))
+_ELPAIS_BODY_XPATHS = (
+    etree.XPath("(//div[@data-dtm-region='articulo_cuerpo'])[1]"),
+    etree.XPath("(//div[normalize-space(@class)='a_c clearfix'])[1]"),
+    _class_xpath('div', 'articulo-cuerpo'),
+)
+_ARTICLE_FALLBACK_XPATHS = (etree.XPath('(//article)[1]'), etree.XPath('(//main)[1]'))
+_BODY_BLOCKS = etree.XPath('descendant::*[self::p or self::div]')
+_BODY_PARAGRAPHS = etree.XPath('descendant::p')
+_ALL_PARAGRAPHS = etree.XPath('//p')
+
+def _parse_html_tree(body):
+    """HTML 바이트를 lxml 트리로 파싱 (인코딩은 BeautifulSoup과 같은 순서로 결정: BOM, meta 선언, 추정, UTF-8)"""
+    detector = EncodingDetector(body, is_html=True)
+    for encoding in detector.encodings:
+        try:
+            parser = etree.HTMLParser(encoding=encoding, strip_cdata=False)
+        except LookupError:
+            continue
+        return etree.fromstring(detector.markup, parser)
+    return etree.fromstring(detector.markup, etree.HTMLParser(strip_cdata=False))
+
+def _first_match(root, xpaths):
+    """XPath들을 차례로 평가해서 처음 찾은 요소 반환"""
+    for xpath in xpaths:
+        found = xpath(root)
+        if found:
+            return found[0]
+    return None
 
 def get_article_content(url):
     """Get actual article content from URL"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # 디스크 캐시를 거쳐 조건부 GET (ETag/Last-Modified가 같으면 304로 캐시 재사용)
+        # 본문은 앞부분만 쓰므로 최대 크기까지만 읽고, 받은 지 ARTICLE_MAX_AGE 이내면 요청 없이 재사용
+        status, html, _ = conditional_get(url, ARTICLE_CACHE_DIR, timeout=10,
+                                          max_bytes=ARTICLE_MAX_BYTES, max_age=ARTICLE_MAX_AGE)
+        if html is None:
+            print(f"기사 내용 추출 오류: HTTP {status} ({url})")
+            return ""
         
-        # 사이트별 본문 추출 로직
+        # 문서를 한 번만 파싱하고 사이트별 본문 요소는 XPath로 찾음
+        root = _parse_html_tree(html)
+        if root is None:
+            return ""
         content = ""
         
         if '20minutos.es' in url:
             # 20minutos 본문 추출
-            article_body = soup.find('div', class_='article-text') or soup.find('div', class_='content')
-            if article_body:
-                paragraphs = article_body.find_all(['p', 'div'])
-                content = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+            article_body = _first_match(root, _20MINUTOS_BODY_XPATHS)
+            if article_body is not None:
+                content = join_texts(node_texts(_BODY_BLOCKS(article_body), 1), 2000)
         
         elif 'elpais.com' in url:
-            # El País 본문 추출
-            article_body = soup.find('div', {'data-dtm-region': 'articulo_cuerpo'}) or \
-                         soup.find('div', class_='a_c clearfix') or \
-                         soup.find('div', class_='articulo-cuerpo')
-            if article_body:
-                paragraphs = article_body.find_all('p')
-                content = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+            # El País 본문 추출 (data 속성, class 순서로 시도)
+            article_body = _first_match(root, _ELPAIS_BODY_XPATHS)
+            if article_body is not None:
+                content = join_texts(node_texts(_BODY_PARAGRAPHS(article_body), 1), 2000)
         
         # 일반적인 기사 본문 추출 (fallback)
         if not content:
             # 일반적인 article 태그나 main 태그에서 추출
-            article = soup.find('article') or soup.find('main')
-            if article:
-                paragraphs = article.find_all('p')
-                content = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()][:10])  # 처음 10개 문단만
+            article = _first_match(root, _ARTICLE_FALLBACK_XPATHS)
+            if article is not None:
+                content = join_texts(islice(node_texts(_BODY_PARAGRAPHS(article), 1), 10), 2000)  # 처음 10개 문단만
         
-        # 내용이 너무 짧으면 다른 방법 시도
+        # 내용이 너무 짧으면 다른 방법 시도 (문서 전체의 <p>)
         if len(content) < 200:
-            all_paragraphs = soup.find_all('p')
-            content = ' '.join([p.get_text().strip() for p in all_paragraphs if len(p.get_text().strip()) > 50][:8])
+            content = join_texts(islice(node_texts(_ALL_PARAGRAPHS(root), 51), 8), 2000)
         
         return content[:2000]  # 처음 2000자만 반환
         
@@ -414,43 +664,102 @@ def get_article_content(url):
         print(f"기사 내용 추출 오류: {e}")
         return ""
 
+# 기사 카테고리 분류 키워드
+CATEGORY_KEYWORDS = {
+    '정치': ['gobierno', 'política', 'elecciones', 'parlamento', 'ministro', 'rey', 'presidente', 'votación', 'congreso'],
+    '경제': ['economía', 'banco', 'euro', 'empleo', 'crisis', 'mercado', 'dinero', 'trabajo', 'empresa', 'inversión'],
+    '사회': ['sociedad', 'educación', 'sanidad', 'vivienda', 'familia', 'salud', 'población', 'ciudadanos'],
+    '스포츠': ['fútbol', 'real madrid', 'barcelona', 'liga', 'deporte', 'partido', 'atletico', 'champions'],
+    '기술': ['tecnología', 'internet', 'móvil', 'digital', 'app', 'inteligencia', 'innovación'],
+    '문화': ['cultura', 'arte', 'música', 'teatro', 'festival', 'libro', 'cine', 'exposición'],
+    '국제': ['internacional', 'mundial', 'europa', 'américa', 'china', 'estados unidos', 'unión europea']
+}
+
+# 팟캐스트 주제 분류 키워드 (먼저 나온 주제가 우선)
+TOPIC_KEYWORDS = {
+    '문법': ['gramática', 'verbos', 'subjuntivo', 'pretérito', 'sintaxis'],
+    '문화': ['cultura', 'tradición', 'costumbres', 'historia', 'arte'],
+    '요리': ['cocina', 'comida', 'receta', 'gastronomía', 'plato'],
+    '여행': ['viajes', 'turismo', 'ciudades', 'lugares', 'destinos'],
+    '직업': ['trabajo', 'empleo', 'profesión', 'carrera', 'oficina'],
+    '가족': ['familia', 'padres', 'hijos', 'matrimonio', 'casa'],
+    '기술': ['tecnología', 'internet', 'móviles', 'digital', 'aplicaciones'],
+    '정치': ['política', 'gobierno', 'elecciones', 'democracia'],
+    '경제': ['economía', 'dinero', 'banco', 'trabajo', 'crisis', 'preferentes', 'ahorros'],
+    '사회': ['sociedad', 'gente', 'problemas', 'cambios', 'vida'],
+    '건강': ['salud', 'medicina', 'hospital', 'enfermedad', 'médico'],
+    '교육': ['educación', 'estudiantes', 'universidad', 'aprender']
+}
+
+def build_keyword_scanner(keywords):
+    """여러 키워드를 정규식 한 번의 스캔으로 찾기 위한 (패턴, 접두어 매핑) 생성
+
+    각 위치에서는 가장 긴 키워드만 매칭되므로, 그 키워드의 접두어인
+    다른 키워드도 함께 찾은 것으로 처리 (예: 'europa' → 'euro')
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+    prefixes = {kw: frozenset(k for k in ordered if kw.startswith(k)) for kw in ordered}
+    return pattern, prefixes
+
+def scan_keywords(text, scanner):
+    """text에 부분 문자열로 등장하는 키워드 집합 반환 (`keyword in text`와 같은 결과)"""
+    pattern, prefixes = scanner
+    found = set()
+    for match in pattern.finditer(text):
+        found |= prefixes[match.group(1)]
+    return found
+
+_CATEGORY_SCANNER = build_keyword_scanner(w for words in CATEGORY_KEYWORDS.values() for w in words)
+_TOPIC_SCANNER = build_keyword_scanner(w for words in TOPIC_KEYWORDS.values() for w in words)
+
+def index_keywords(table):
+    """{분류: [키워드...]} → {키워드: [분류...]} 역색인"""
+    index = {}
+    for label, words in table.items():
+        for word in dict.fromkeys(words):
+            index.setdefault(word, []).append(label)
+    return index
+
+# 점수 계산이 전체 키워드 수가 아닌 찾은 키워드 수에 비례하도록 역색인 사용
+_KEYWORD_CATEGORIES = index_keywords(CATEGORY_KEYWORDS)
+
+# 찾은 키워드 집합과 비교할 주제별 키워드
+_TOPIC_SETS = {topic: frozenset(words) for topic, words in TOPIC_KEYWORDS.items()}
+
+@lru_cache(maxsize=512)
 def extract_category_from_content(title, content):
     """Extract category from title and content"""
-    full_text = (title + " " + content).lower()
-    
-    keywords = {
-        '정치': ['gobierno', 'política', 'elecciones', 'parlamento', 'ministro', 'rey', 'presidente', 'votación', 'congreso'],
-        '경제': ['economía', 'banco', 'euro', 'empleo', 'crisis', 'mercado', 'dinero', 'trabajo', 'empresa', 'inversión'],
-        '사회': ['sociedad', 'educación', 'sanidad', 'vivienda', 'familia', 'salud', 'población', 'ciudadanos'],
-        '스포츠': ['fútbol', 'real madrid', 'barcelona', 'liga', 'deporte', 'partido', 'atletico', 'champions'],
-        '기술': ['tecnología', 'internet', 'móvil', 'digital', 'app', 'inteligencia', 'innovación'],
-        '문화': ['cultura', 'arte', 'música', 'teatro', 'festival', 'libro', 'cine', 'exposición'],
-        '국제': ['internacional', 'mundial', 'europa', 'américa', 'china', 'estados unidos', 'unión europea']
-    }
+    found = scan_keywords((title + " " + content).lower(), _CATEGORY_SCANNER)
     
-    category_scores = {}
-    for category, words in keywords.items():
-        score = sum(1 for word in words if word in full_text)
-        if score > 0:
-            category_scores[category] = score
+    category_scores = Counter(category for word in found for category in _KEYWORD_CATEGORIES[word])
     
     if category_scores:
-        return max(category_scores, key=category_scores.get)
+        # 동점이면 CATEGORY_KEYWORDS에서 먼저 나온 카테고리
+        return max(CATEGORY_KEYWORDS, key=category_scores.__getitem__)
     return '일반'
 
+# 에피소드 번호 패턴 - 그룹 번호가 우선순위 (Ep > Episode > # > 3-4자리 숫자)
+_EP_NUMBER_RE = re.compile(r'Ep\.?\s*(\d+)|Episode\s*(\d+)|#(\d+)|(\d{3,4})', re.IGNORECASE)
+
+# 요약 속 재생시간 패턴 - (정규식, 분:초 형식 여부)
+_DURATION_RES = [
+    (re.compile(r'(\d+)\s*min'), False),
+    (re.compile(r'(\d+)\s*분'), False),
+    (re.compile(r'(\d+):(\d+)'), True),
+    (re.compile(r'Duration:\s*(\d+)'), False)
+]
+
+@lru_cache(maxsize=512)
 def extract_episode_number(title):
-    patterns = [
-        r'Ep\.?\s*(\d+)',
-        r'Episode\s*(\d+)',
-        r'#(\d+)',
-        r'(\d{3,4})'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
-        if match:
+    # 제목을 한 번만 스캔하고, 우선순위가 가장 높은 패턴의 첫 번째 결과 사용
+    best = None
+    for match in _EP_NUMBER_RE.finditer(title):
+        if match.lastindex == 1:
             return match.group(1)
-    return None
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+    return best.group(best.lastindex) if best else None
 
 def extract_duration_from_feed(entry):
     # iTunes 듀레이션 먼저 확인
@@ -464,48 +773,50 @@ def extract_duration_from_feed(entry):
             return f"{minutes}:{seconds:02d}"
         return duration
     
-    # 요약에서 재생시간 추출 시도
-    summary = entry.get('summary', '') + entry.get('description', '')
-    duration_patterns = [
-        r'(\d+)\s*min',
-        r'(\d+)\s*분',
-        r'(\d+):(\d+)',
-        r'Duration:\s*(\d+)'
-    ]
-    
-    for pattern in duration_patterns:
-        match = re.search(pattern, summary)
-        if match:
-            if ':' in pattern:
-                return f"{match.group(1)}:{match.group(2)}"
-            else:
-                return f"{match.group(1)}분"
+    # 요약에서 재생시간 추출 시도 (필드를 이어 붙이지 않고 각각 검색)
+    summary = entry.get('summary', '')
+    description = entry.get('description', '')
+    # feedparser는 description을 summary의 별칭으로 두는 경우가 많음
+    fields = (summary,) if description == summary else (summary, description)
+    for pattern, is_clock in _DURATION_RES:
+        for field in fields:
+            match = pattern.search(field)
+            if match:
+                if is_clock:
+                    return f"{match.group(1)}:{match.group(2)}"
+                else:
+                    return f"{match.group(1)}분"
     
     return "15-25분"
 
+@lru_cache(maxsize=512)
 def extract_topic_keywords(title, summary=""):
-    content = (title + " " + summary).lower()
-    
-    topic_keywords = {
-        '문법': ['gramática', 'verbos', 'subjuntivo', 'pretérito', 'sintaxis'],
-        '문화': ['cultura', 'tradición', 'costumbres', 'historia', 'arte'],
-        '요리': ['cocina', 'comida', 'receta', 'gastronomía', 'plato'],
-        '여행': ['viajes', 'turismo', 'ciudades', 'lugares', 'destinos'],
-        '직업': ['trabajo', 'empleo', 'profesión', 'carrera', 'oficina'],
-        '가족': ['familia', 'padres', 'hijos', 'matrimonio', 'casa'],
-        '기술': ['tecnología', 'internet', 'móviles', 'digital', 'aplicaciones'],
-        '정치': ['política', 'gobierno', 'elecciones', 'democracia'],
-        '경제': ['economía', 'dinero', 'banco', 'trabajo', 'crisis', 'preferentes', 'ahorros'],
-        '사회': ['sociedad', 'gente', 'problemas', 'cambios', 'vida'],
-        '건강': ['salud', 'medicina', 'hospital', 'enfermedad', 'médico'],
-        '교육': ['educación', 'estudiantes', 'universidad', 'aprender']
-    }
+    # 제목과 요약을 이어 붙이지 않고 각각 스캔 (주제 키워드에는 공백이 없어 결과 동일)
+    found = scan_keywords(title.lower(), _TOPIC_SCANNER)
+    if summary:
+        found |= scan_keywords(summary.lower(), _TOPIC_SCANNER)
     
-    for topic, keywords in topic_keywords.items():
-        if any(keyword in content for keyword in keywords):
+    for topic, keywords in _TOPIC_SETS.items():
+        if not keywords.isdisjoint(found):
             return topic
     return '일반 주제'
 
+# 팟캐스트 주제별 학습목표
+LEARNING_GOALS = {
+    '경제': '금융 표현',
+    '정치': '정치 표현',
+    '문화': '문화 표현',
+    '사회': '사회 이슈 표현',
+    '교육': '교육 관련 표현',
+    '건강': '의료 표현',
+    '기술': '기술 표현',
+    '문법': '문법 구조',
+    '스페인어 학습': '일상 표현'
+}
+
+# "분:초" 형식의 재생시간 (분만 캡처)
+_DURATION_MINUTES_RE = re.compile(r'(\d+):\d+')
+
 def create_detailed_memo(content_type, data, weekday_name):
     if content_type == "article":
         category = data.get('category', '일반')
@@ -558,6 +869,9 @@ def create_detailed_memo(content_type, data, weekday_name):
         expressions = []
         episode_url = data.get('url', '')
         
+        # 콘텐츠 수집 중 Apple Podcast에서 찾은 정확한 URL (재사용 시에는 수집 당시 저장된 값)
+        found_apple_url = data.get('found_apple_url')
+        
         # 이미 분석된 구어체 표현이 있는지 확인
         if data.get('colloquial_analyzed') and data.get('colloquial_expressions'):
             print(f"  ✅ 이미 분석된 구어체 표현 재사용 ({len(data['colloquial_expressions'])}개)")
@@ -576,7 +890,7 @@ def create_detailed_memo(content_type, data, weekday_name):
                 print(f"  📺 에피소드: {episode_title}")
                 print(f"  🔗 원본 URL: {episode_url}")
                 
-                transcript_content = get_podcast_transcript_or_content(episode_url, episode_title)
+                transcript_content, found_apple_url = get_podcast_transcript_or_content(episode_url, episode_title)
                 
                 print(f"\n  📊 콘텐츠 수집 결과:")
                 print(f"  📏 수집된 콘텐츠 길이: {len(transcript_content) if transcript_content else 0}자")
@@ -593,41 +907,22 @@ def create_detailed_memo(content_type, data, weekday_name):
                     expressions = []
         
         # Apple Podcast에서 정확한 URL을 찾았는지 확인
-        found_apple_url = get_found_apple_url()
         if found_apple_url:
             print(f"    🍎 Apple Podcast 정확한 URL 발견: {found_apple_url}")
             # 데이터에 정확한 Apple URL 업데이트
             data['apple_link'] = found_apple_url
         
         # 주제에 따른 학습목표 설정
-        learning_goals = {
-            '경제': '금융 표현',
-            '정치': '정치 표현',
-            '문화': '문화 표현',
-            '사회': '사회 이슈 표현',
-            '교육': '교육 관련 표현',
-            '건강': '의료 표현',
-            '기술': '기술 표현',
-            '문법': '문법 구조',
-            '스페인어 학습': '일상 표현'
-        }
-        goal = learning_goals.get(topic, '핵심 표현')
+        goal = LEARNING_GOALS.get(topic, '핵심 표현')
         
-        # 재생시간에 따른 청취 계획 설정
-        if ':' in duration:
-            try:
-                minutes, seconds = duration.split(':')
-                total_minutes = int(minutes)
-                if total_minutes > 30:
-                    listen_plan = f"(30분 청취 목표)"
-                elif total_minutes > 20:
-                    listen_plan = f"(전체 {duration} 청취)"
-                else:
-                    listen_plan = f"(전체 {duration} 청취)"
-            except:
-                listen_plan = "(25분 청취 목표)"
-        else:
+        # 재생시간(분:초)에 따른 청취 계획 설정
+        duration_match = _DURATION_MINUTES_RE.fullmatch(duration)
+        if duration_match is None:
             listen_plan = "(25분 청취 목표)"
+        elif int(duration_match.group(1)) > 30:
+            listen_plan = "(30분 청취 목표)"
+        else:
+            listen_plan = f"(전체 {duration} 청취)"
         
         # 에피소드 번호가 있으면 표시, 없으면 생략
         episode_text = f"Ep.{episode_num} - " if episode_num else ""
@@ -687,30 +982,37 @@ def create_detailed_memo(content_type, data, weekday_name):
                f"{url_info}"
                f"{listening_strategy}")
 
+# Radio Ambulante URL 슬러그 생성용 패턴
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+_RADIO_AMBULANTE_AUDIO_RE = re.compile(r'https://radioambulante\.org/audio/[^\s<>"]+')
+
+def make_slug(title):
+    """제목에서 특수 문자를 제거하고 공백을 하이픈으로 바꾼 URL 슬러그 생성"""
+    return _SLUG_DASH_RE.sub('-', _SLUG_STRIP_RE.sub('', title)).strip('-')
+
 def extract_radio_ambulante_url(entry):
     """Extract actual Radio Ambulante website URL"""
     try:
         # 에피소드 제목에서 슬러그 생성 시도
         title = entry.title.lower()
         # 특수 문자 제거 및 공백을 하이픈으로 변환
-        import re
-        slug = re.sub(r'[^\w\s-]', '', title)
-        slug = re.sub(r'[-\s]+', '-', slug).strip('-')
+        slug = make_slug(title)
         
         # Radio Ambulante 웹사이트 URL 생성
         radio_ambulante_url = f"https://radioambulante.org/audio/{slug}"
         
-        # URL 유효성 확인
-        if validate_url(radio_ambulante_url):
-            return radio_ambulante_url
-        
-        # 슬러그 생성 실패 시 요약에서 링크 찾기
+        # 슬러그 URL이 유효하지 않을 때를 대비해 요약에서도 링크 찾기
         summary = entry.get('summary', '') + entry.get('description', '')
-        url_match = re.search(r'https://radioambulante\.org/audio/[^\s<>"]+', summary)
-        if url_match:
-            found_url = url_match.group(0)
-            if validate_url(found_url):
-                return found_url
+        url_match = _RADIO_AMBULANTE_AUDIO_RE.search(summary)
+        found_url = url_match.group(0) if url_match else None
+        
+        # 두 후보를 동시에 검증하고 슬러그 URL을 우선 사용
+        valid = validate_urls([radio_ambulante_url, found_url])
+        if valid[radio_ambulante_url]:
+            return radio_ambulante_url
+        if found_url and valid[found_url]:
+            return found_url
                 
         # 모든 시도 실패시 None 반환
         return None
@@ -719,56 +1021,147 @@ def extract_radio_ambulante_url(entry):
         print(f"Radio Ambulante URL 추출 오류: {e}")
         return None
 
+def resolve_final_urls(podcast_name, episode_link, apple_link, apple_base):
+    """최종 에피소드 URL과 Apple 링크 결정 - (final_episode_url, apple_link)
+    
+    Radio Ambulante는 Apple에서 찾은 에피소드 링크를 메인 URL로 사용 (못 찾으면 원본 링크와 기본 Apple 링크),
+    그 외에는 원본 링크가 유효하지 않을 때만 Apple 링크로 대체
+    """
+    if 'Radio Ambulante' in podcast_name:
+        if apple_link != apple_base and validate_url(apple_link):
+            return apple_link, apple_link
+        return episode_link, apple_base
+    
+    # 원본 링크와 Apple 링크를 동시에 검증
+    valid = validate_urls([episode_link, apple_link])
+    if not valid.get(apple_link, False):
+        apple_link = apple_base
+    final_episode_url = episode_link if valid.get(episode_link, False) else apple_link
+    return final_episode_url, apple_link
+
+def build_podcast_data(entry, podcast_name, apple_base, display_name, default_difficulty="B2"):
+    """피드 항목으로 팟캐스트 데이터 생성 (에피소드 번호, 재생시간, 주제, 최종 URL, Apple 링크, 난이도)"""
+    title = entry.title
+    summary = entry.get('summary', '')
+    episode_number = extract_episode_number(title)
+    
+    episode_link = entry.link
+    
+    # Radio Ambulante인 경우 실제 웹사이트 URL 시도
+    if 'Radio Ambulante' in podcast_name:
+        radio_ambulante_url = extract_radio_ambulante_url(entry)
+        if radio_ambulante_url:
+            print(f"  Radio Ambulante 웹사이트 URL: {radio_ambulante_url}")
+            episode_link = radio_ambulante_url
+        else:
+            print(f"  Radio Ambulante 웹사이트 URL 추출 실패, RSS URL 사용")
+    
+    # Apple Podcasts 링크 생성
+    apple_link = generate_apple_podcast_link(podcast_name, apple_base, episode_link, episode_number, title)
+    
+    # 최종 URL 결정
+    final_episode_url, apple_link = resolve_final_urls(podcast_name, episode_link, apple_link, apple_base)
+    
+    return {
+        'title': title,
+        'url': final_episode_url,
+        'apple_link': apple_link,
+        'published': entry.get('published', ''),
+        'duration': extract_duration_from_feed(entry),
+        'episode_number': episode_number or 'N/A',
+        'topic': extract_topic_keywords(title, summary),
+        'podcast_name': display_name,
+        'summary': summary[:200],
+        'difficulty': analyze_text_difficulty(summary) if summary else default_difficulty
+    }
+
 def validate_url(url, timeout=5):
-    """Validate URL quickly"""
+    """Validate URL quickly (같은 실행에서 이미 확인한 URL은 캐시된 결과 사용)"""
+    if not url:
+        return False
+    
+    # 캐시 키 정규화: scheme/host는 대소문자 구분이 없고, fragment는 서버로 전송되지 않으므로 제거
+    # (경로와 쿼리는 에피소드 식별에 쓰이므로 그대로 유지)
     try:
-        if not url or not (url.startswith('http://') or url.startswith('https://')):
-            return False
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+        parts = urllib.parse.urlsplit(url.strip())
+    except ValueError:
+        return False
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https') or not parts.netloc:
+        return False
+    normalized = urllib.parse.urlunsplit((scheme, parts.netloc.lower(), parts.path or '/', parts.query, ''))
+    return _validate_url_cached(normalized, timeout)
+
+def validate_urls(urls, timeout=5):
+    """여러 URL을 동시에 검증 - {url: 유효 여부} (None은 제외)"""
+    urls = list(dict.fromkeys(url for url in urls if url))
+    if len(urls) <= 1:
+        return {url: validate_url(url, timeout) for url in urls}
+    
+    with ThreadPoolExecutor(max_workers=min(len(urls), URL_CHECK_WORKERS)) as pool:
+        return dict(zip(urls, pool.map(lambda url: validate_url(url, timeout), urls)))
+
+@lru_cache(maxsize=4096)
+def _validate_url_cached(url, timeout):
+    """HEAD 요청으로 URL 유효성 확인 (성공/실패 모두 캐시)"""
+    try:
+        response = get_session().head(url, headers=HTML_HEADERS, timeout=timeout, allow_redirects=True)
         return response.status_code < 400
     except:
         return False
 
+# 실제 작동하는 스페인어 팟캐스트들만 (대안 후보)
+WORKING_PODCASTS = {
+    "SpanishPodcast": {
+        "name": "SpanishPodcast",
+        "rss": "https://feeds.feedburner.com/SpanishPodcast",
+        "apple_base": "https://podcasts.apple.com/us/podcast/spanishpodcast/id70077665",
+        "region": "스페인"
+    },
+    "Hoy Hablamos": {
+        "name": "Hoy Hablamos",
+        "rss": "https://www.hoyhablamos.com/feed/podcast/",
+        "apple_base": "https://podcasts.apple.com/es/podcast/hoy-hablamos/id1455031513",
+        "region": "스페인"
+    }
+}
+
+# 팟캐스트 이름별 대안 목록 (자기 자신 제외) - 목록에 없는 팟캐스트는 전체가 대안
+_ALL_ALTERNATIVES = tuple(WORKING_PODCASTS.items())
+_ALTERNATIVES_BY_NAME = {
+    name: tuple(item for item in _ALL_ALTERNATIVES if item[0] != name)
+    for name in WORKING_PODCASTS
+}
+
 def get_alternative_podcasts(current_weekday, current_podcast_name):
     """현재 요일과 팟캐스트를 제외한 대안 팟캐스트 목록 반환 (실제 작동하는 피드들만)"""
-    # 실제 작동하는 스페인어 팟캐스트들만
-    working_podcasts = {
-        "SpanishPodcast": {
-            "name": "SpanishPodcast",
-            "rss": "https://feeds.feedburner.com/SpanishPodcast",
-            "apple_base": "https://podcasts.apple.com/us/podcast/spanishpodcast/id70077665",
-            "region": "스페인"
-        },
-        "Hoy Hablamos": {
-            "name": "Hoy Hablamos",
-            "rss": "https://www.hoyhablamos.com/feed/podcast/",
-            "apple_base": "https://podcasts.apple.com/es/podcast/hoy-hablamos/id1455031513",
-            "region": "스페인"
-        }
-    }
-    
-    # 현재 팟캐스트를 제외한 대안들 반환
-    alternatives = []
-    for name, info in working_podcasts.items():
-        if name != current_podcast_name:
-            alternatives.append((name, info))
-    
-    return alternatives
+    return list(_ALTERNATIVES_BY_NAME.get(current_podcast_name, _ALL_ALTERNATIVES))
 
 
 
 def try_alternative_podcast(alternatives, weekday_name):
     """대안 팟캐스트들을 시도해서 중복되지 않은 에피소드 찾기"""
-    for alt_name, alt_info in alternatives:
+    if not alternatives:
+        print("\n❌ 모든 대안 팟캐스트에서도 새로운 에피소드를 찾지 못했습니다.")
+        return None
+    
+    # 모든 대안 피드를 동시에 요청하되, 결과는 원래 순서대로 확인
+    pool = ThreadPoolExecutor(max_workers=min(len(alternatives), FEED_FETCH_WORKERS))
+    feed_futures = [pool.submit(fetch_feed, alt_info['rss']) for _, alt_info in alternatives]
+    try:
+        return _select_alternative_episode(alternatives, feed_futures)
+    finally:
+        # 에피소드를 찾으면 아직 시작하지 않은 요청은 취소
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _select_alternative_episode(alternatives, feed_futures):
+    """대안 순서대로 피드 결과를 확인해서 처음 찾은 에피소드 데이터 반환"""
+    for (alt_name, alt_info), feed_future in zip(alternatives, feed_futures):
         try:
             print(f"\n🔄 대안 팟캐스트 시도: {alt_name}")
             print(f"   RSS: {alt_info['rss']}")
             
-            feed = feedparser.parse(alt_info['rss'])
+            feed = feed_future.result()
             
             if not feed.entries:
                 print(f"   ❌ {alt_name}: 에피소드가 없음")
@@ -786,57 +1179,13 @@ def try_alternative_podcast(alternatives, weekday_name):
                 
                 print(f"   ✅ {alt_name}에서 새로운 에피소드 발견!")
                 
-                # 에피소드 데이터 생성
-                episode_number = extract_episode_number(episode_title)
-                duration = extract_duration_from_feed(entry)
-                topic = extract_topic_keywords(episode_title, entry.get('summary', ''))
-                
-                episode_link = entry.link
-                
-                # Radio Ambulante인 경우 실제 웹사이트 URL 시도
-                if 'Radio Ambulante' in alt_name:
-                    radio_ambulante_url = extract_radio_ambulante_url(entry)
-                    if radio_ambulante_url:
-                        episode_link = radio_ambulante_url
-                
-                # Apple Podcasts 링크 생성
-                apple_link = generate_apple_podcast_link(alt_name, alt_info['apple_base'], episode_link, episode_number, episode_title)
-                
-                # Radio Ambulante의 경우 Apple에서 찾지 못하면 에피소드 URL을 메인 URL로 사용
-                final_episode_url = episode_link
-                if 'Radio Ambulante' in alt_name:
-                    if apple_link != alt_info['apple_base'] and validate_url(apple_link):
-                        final_episode_url = apple_link
-                    else:
-                        final_episode_url = episode_link
-                        apple_link = alt_info['apple_base']
-                else:
-                    if not validate_url(episode_link):
-                        final_episode_url = apple_link if validate_url(apple_link) else alt_info['apple_base']
-                    if not validate_url(apple_link):
-                        apple_link = alt_info['apple_base']
-                
-                # 대안 팟캐스트 난이도 분석
-                alt_summary = entry.get('summary', '')
-                alt_difficulty = analyze_text_difficulty(alt_summary) if alt_summary else "B2"
-                
-                podcast_data = {
-                    'title': episode_title,
-                    'url': final_episode_url,
-                    'apple_link': apple_link,
-                    'published': entry.get('published', ''),
-                    'duration': duration,
-                    'episode_number': episode_number or 'N/A',
-                    'topic': topic,
-                    'podcast_name': f"{alt_name} (대안)",  # 대안임을 표시
-                    'summary': entry.get('summary', '')[:200],
-                    'difficulty': alt_difficulty  # 난이도 정보 추가
-                }
+                # 에피소드 데이터 생성 (대안임을 표시)
+                podcast_data = build_podcast_data(entry, alt_name, alt_info['apple_base'], f"{alt_name} (대안)")
                 
                 print(f"   📊 대안 팟캐스트 데이터:")
                 print(f"      에피소드: {episode_title}")
-                print(f"      URL: {final_episode_url}")
-                print(f"      Apple: {apple_link}")
+                print(f"      URL: {podcast_data['url']}")
+                print(f"      Apple: {podcast_data['apple_link']}")
                 
                 return podcast_data
                 
@@ -866,30 +1215,33 @@ def find_alternative_episode_with_colloquialisms(current_podcast_data, verified_
     if current_feed_info:
         print(f"\n📡 {current_podcast_name}에서 다른 에피소드들 시도...")
         
+        # 이미 콘텐츠를 확인한 에피소드 (다음 시도에서 같은 에피소드를 다시 요청하지 않음)
+        tried_links = set()
         for attempt in range(max_attempts):
             try:
                 print(f"\n🎧 시도 {attempt + 1}/{max_attempts}")
                 
-                feed = feedparser.parse(current_feed_info["rss"])
+                feed = fetch_feed(current_feed_info["rss"])
                 if not feed.entries:
                     print(f"   ❌ 피드에 에피소드가 없음")
                     break
                 
-                # 다른 에피소드 선택 (현재 것 제외)
-                import random
-                available_episodes = [ep for ep in feed.entries if ep.title != current_title]
+                # 다른 에피소드 선택 (현재 것과 이전 시도에서 확인한 것 제외, 앞쪽 일부 에피소드만 검색)
+                available_episodes = [ep for ep in islice(feed.entries, EPISODE_SCAN_LIMIT)
+                                      if ep.title != current_title and ep.link not in tried_links]
                 if not available_episodes:
                     print(f"   ❌ 다른 에피소드가 없음")
                     break
                 
                 # 랜덤하게 다른 에피소드 선택
                 selected_episode = random.choice(available_episodes)
+                tried_links.add(selected_episode.link)
                 print(f"   📺 선택된 에피소드: {selected_episode.title}")
                 
                 # 구어체 분석을 위한 콘텐츠 수집
                 episode_url = selected_episode.link
                 print(f"   🔍 구어체 분석을 위한 콘텐츠 수집...")
-                transcript_content = get_podcast_transcript_or_content(episode_url, selected_episode.title)
+                transcript_content, _ = get_podcast_transcript_or_content(episode_url, selected_episode.title)
                 
                 if transcript_content:
                     print(f"   📊 콘텐츠 수집 성공 (길이: {len(transcript_content)}자)")
@@ -903,51 +1255,9 @@ def find_alternative_episode_with_colloquialisms(current_podcast_data, verified_
                             print(f"      {i}. {expr}")
                         
                         # 새로운 팟캐스트 데이터 생성
-                        episode_number = extract_episode_number(selected_episode.title)
-                        duration = extract_duration_from_feed(selected_episode)
-                        topic = extract_topic_keywords(selected_episode.title, selected_episode.get('summary', ''))
-                        
-                        episode_link = selected_episode.link
-                        
-                        # Radio Ambulante인 경우 실제 웹사이트 URL 시도
-                        if 'Radio Ambulante' in current_podcast_name:
-                            radio_ambulante_url = extract_radio_ambulante_url(selected_episode)
-                            if radio_ambulante_url:
-                                episode_link = radio_ambulante_url
-                        
-                        # Apple Podcasts 링크 생성
-                        apple_link = generate_apple_podcast_link(current_podcast_name, current_feed_info["apple"], episode_link, episode_number, selected_episode.title)
-                        
-                        # 최종 URL 결정
-                        final_episode_url = episode_link
-                        if 'Radio Ambulante' in current_podcast_name:
-                            if apple_link != current_feed_info["apple"] and validate_url(apple_link):
-                                final_episode_url = apple_link
-                            else:
-                                final_episode_url = episode_link
-                                apple_link = current_feed_info["apple"]
-                        else:
-                            if not validate_url(episode_link):
-                                final_episode_url = apple_link if validate_url(apple_link) else current_feed_info["apple"]
-                            if not validate_url(apple_link):
-                                apple_link = current_feed_info["apple"]
-                        
-                        # 새로운 에피소드 난이도 분석
-                        episode_summary = selected_episode.get('summary', '')
-                        episode_difficulty = analyze_text_difficulty(episode_summary) if episode_summary else current_podcast_data['difficulty']
-                        
-                        new_podcast_data = {
-                            'title': selected_episode.title,
-                            'url': final_episode_url,
-                            'apple_link': apple_link,
-                            'published': selected_episode.get('published', ''),
-                            'duration': duration,
-                            'episode_number': episode_number or 'N/A',
-                            'topic': topic,
-                            'podcast_name': f"{current_podcast_name} (구어체 대안)",
-                            'summary': selected_episode.get('summary', '')[:200],
-                            'difficulty': episode_difficulty
-                        }
+                        new_podcast_data = build_podcast_data(
+                            selected_episode, current_podcast_name, current_feed_info["apple"],
+                            f"{current_podcast_name} (구어체 대안)", current_podcast_data['difficulty'])
                         
                         print(f"   ✅ 구어체 표현이 있는 대체 에피소드 발견!")
                         return new_podcast_data
@@ -970,77 +1280,46 @@ def find_alternative_episode_with_colloquialisms(current_podcast_data, verified_
         try:
             print(f"\n🎧 {alt_name} 시도 중...")
             
-            feed = feedparser.parse(alt_info["rss"])
+            feed = fetch_feed(alt_info["rss"])
             if not feed.entries:
                 print(f"   ❌ {alt_name}: 에피소드가 없음")
                 continue
             
-            # 최근 몇 개 에피소드 확인
-            for episode in feed.entries[:3]:
-                print(f"   📺 에피소드 확인: {episode.title}")
-                
-                # 구어체 분석을 위한 콘텐츠 수집
-                episode_url = episode.link
-                transcript_content = get_podcast_transcript_or_content(episode_url, episode.title)
-                
-                if transcript_content:
-                    expressions = extract_vocabulary_expressions_from_transcript(transcript_content, current_podcast_data['difficulty'])
+            # 최근 몇 개 에피소드의 콘텐츠 수집을 동시에 시작하고 결과는 순서대로 확인
+            # (날짜 체크를 먼저 해서 오래된 에피소드는 콘텐츠를 요청하지 않음)
+            candidates = list(islice((episode for episode in islice(feed.entries, EPISODE_SCAN_LIMIT)
+                                      if is_episode_recent(episode.get('published_parsed'))), 3))
+            if not candidates:
+                print(f"   ❌ {alt_name}: 최근 에피소드가 없음")
+                continue
+            pool = ThreadPoolExecutor(max_workers=len(candidates))
+            futures = [pool.submit(get_podcast_transcript_or_content, episode.link, episode.title)
+                       for episode in candidates]
+            try:
+                for episode, future in zip(candidates, futures):
+                    print(f"   📺 에피소드 확인: {episode.title}")
                     
-                    if expressions and len(expressions) > 0:
-                        print(f"   🎯 {alt_name}에서 구어체 표현 발견! ({len(expressions)}개)")
-                        
-                        # 새로운 팟캐스트 데이터 생성
-                        episode_number = extract_episode_number(episode.title)
-                        duration = extract_duration_from_feed(episode)
-                        topic = extract_topic_keywords(episode.title, episode.get('summary', ''))
-                        
-                        episode_link = episode.link
-                        
-                        # Radio Ambulante인 경우 실제 웹사이트 URL 시도
-                        if 'Radio Ambulante' in alt_name:
-                            radio_ambulante_url = extract_radio_ambulante_url(episode)
-                            if radio_ambulante_url:
-                                episode_link = radio_ambulante_url
-                        
-                        # Apple Podcasts 링크 생성
-                        apple_link = generate_apple_podcast_link(alt_name, alt_info["apple"], episode_link, episode_number, episode.title)
+                    # 구어체 분석을 위한 콘텐츠 수집 (백그라운드에서 진행 중)
+                    transcript_content, _ = future.result()
+                    
+                    if transcript_content:
+                        expressions = extract_vocabulary_expressions_from_transcript(transcript_content, current_podcast_data['difficulty'])
                         
-                        # 최종 URL 결정
-                        final_episode_url = episode_link
-                        if 'Radio Ambulante' in alt_name:
-                            if apple_link != alt_info["apple"] and validate_url(apple_link):
-                                final_episode_url = apple_link
-                            else:
-                                final_episode_url = episode_link
-                                apple_link = alt_info["apple"]
+                        if expressions and len(expressions) > 0:
+                            print(f"   🎯 {alt_name}에서 구어체 표현 발견! ({len(expressions)}개)")
+                            
+                            # 새로운 팟캐스트 데이터 생성
+                            new_podcast_data = build_podcast_data(
+                                episode, alt_name, alt_info["apple"],
+                                f"{alt_name} (구어체 대안)", current_podcast_data['difficulty'])
+                            
+                            print(f"   ✅ {alt_name}에서 구어체 표현이 있는 에피소드 발견!")
+                            return new_podcast_data
                         else:
-                            if not validate_url(episode_link):
-                                final_episode_url = apple_link if validate_url(apple_link) else alt_info["apple"]
-                            if not validate_url(apple_link):
-                                apple_link = alt_info["apple"]
-                        
-                        # 새로운 에피소드 난이도 분석
-                        episode_summary = episode.get('summary', '')
-                        episode_difficulty = analyze_text_difficulty(episode_summary) if episode_summary else current_podcast_data['difficulty']
-                        
-                        new_podcast_data = {
-                            'title': episode.title,
-                            'url': final_episode_url,
-                            'apple_link': apple_link,
-                            'published': episode.get('published', ''),
-                            'duration': duration,
-                            'episode_number': episode_number or 'N/A',
-                            'topic': topic,
-                            'podcast_name': f"{alt_name} (구어체 대안)",
-                            'summary': episode.get('summary', '')[:200],
-                            'difficulty': episode_difficulty
-                        }
-                        
-                        print(f"   ✅ {alt_name}에서 구어체 표현이 있는 에피소드 발견!")
-                        return new_podcast_data
-                    else:
-                        print(f"   📝 이 에피소드도 구어체 표현 부족")
-                        
+                            print(f"   📝 이 에피소드도 구어체 표현 부족")
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+                
         except Exception as e:
             print(f"   ❌ {alt_name} 시도 중 오류: {e}")
             continue
@@ -1052,6 +1331,11 @@ def find_alternative_episode_with_colloquialisms(current_podcast_data, verified_
 # 스페인어 콘텐츠 검증 함수들 (선택적 사용)
 # ==========================================
 
+# 빠른 언어 판별용 단어 (등장한 종류 수를 비교)
+# 단어마다 `in` 검사는 첫 등장 위치에서 바로 끝나므로 하나의 정규식으로 합치는 것보다 빠름
+_SPANISH_HINTS = ('el ', 'la ', 'es ', 'que ', 'con ', 'de ', 'en ', 'por ', 'para ', 'ñ')
+_ENGLISH_HINTS = ('the ', 'and ', 'is ', 'are ', 'was ', 'were ', 'this ', 'that ')
+
 def verify_spanish_content_with_llm(content, title="", use_llm=False):
     """
     선택적으로 LLM을 사용하여 콘텐츠가 스페인어인지 검증
@@ -1062,14 +1346,22 @@ def verify_spanish_content_with_llm(content, title="", use_llm=False):
     
     # LLM 사용하지 않는 경우 (기본값) - 빠른 기본 검증만
     if not use_llm:
-        spanish_patterns = ['el ', 'la ', 'es ', 'que ', 'con ', 'de ', 'en ', 'por ', 'para ', 'ñ']
-        english_patterns = ['the ', 'and ', 'is ', 'are ', 'was ', 'were ', 'this ', 'that ']
-        
         content_lower = content.lower()
-        spanish_count = sum(1 for pattern in spanish_patterns if pattern in content_lower)
-        english_count = sum(1 for pattern in english_patterns if pattern in content_lower)
+        spanish_count = sum(1 for pattern in _SPANISH_HINTS if pattern in content_lower)
         
-        return spanish_count > english_count
+        # 결과가 이미 정해졌으면 영어 단어는 확인하지 않음
+        if spanish_count == 0:
+            return False
+        if spanish_count > len(_ENGLISH_HINTS):
+            return True
+        
+        english_count = 0
+        for pattern in _ENGLISH_HINTS:
+            if pattern in content_lower:
+                english_count += 1
+                if english_count >= spanish_count:
+                    return False
+        return True
     
     # LLM 사용하는 경우 (선택적 더블체크)
     if not LLM_AVAILABLE or not os.environ.get('OPENAI_API_KEY'):
@@ -1077,7 +1369,7 @@ def verify_spanish_content_with_llm(content, title="", use_llm=False):
         return verify_spanish_content_with_llm(content, title, use_llm=False)
     
     try:
-        analyzer = SpanishLLMAnalyzer()
+        analyzer = _get_analyzer()
         
         # LLM에게 언어 검증 요청
         verification_prompt = f"""
@@ -1104,6 +1396,18 @@ def verify_spanish_content_with_llm(content, title="", use_llm=False):
         # 오류 시 기본 검증 방법 사용
         return verify_spanish_content_with_llm(content, title, use_llm=False)
 
+# 명확한 스페인어 지표들
+_SPANISH_INDICATORS = (
+    'radio ambulante', 'español', 'española', 'spanishpodcast',
+    'hoy hablamos', 'dele', 'notes in spanish', 'ñ', 'españolistos'
+)
+
+# 명확한 영어 지표들 (혹시 모를 경우를 위해)
+_ENGLISH_INDICATORS = (
+    'the daily', 'journalism', 'nytimes', 'npr', 'america',
+    'president', 'congress', 'election', 'english'
+)
+
 def is_spanish_content_by_title(title, summary="", use_llm_verification=False):
     """
     제목과 요약으로 스페인어 콘텐츠인지 판단
@@ -1119,24 +1423,12 @@ def is_spanish_content_by_title(title, summary="", use_llm_verification=False):
     # 기본 빠른 검증 (검증된 피드이므로 대부분 통과)
     content_lower = content.lower()
     
-    # 명확한 스페인어 지표들
-    spanish_indicators = [
-        'radio ambulante', 'español', 'española', 'spanishpodcast', 
-        'hoy hablamos', 'dele', 'notes in spanish', 'ñ', 'españolistos'
-    ]
-    
-    # 명확한 영어 지표들 (혹시 모를 경우를 위해)
-    english_indicators = [
-        'the daily', 'journalism', 'nytimes', 'npr', 'america', 
-        'president', 'congress', 'election', 'english'
-    ]
-    
     # 명확한 경우 판단
-    if any(indicator in content_lower for indicator in spanish_indicators):
+    if any(indicator in content_lower for indicator in _SPANISH_INDICATORS):
         print(f"✅ 스페인어 지표 발견")
         return True
     
-    if any(indicator in content_lower for indicator in english_indicators):
+    if any(indicator in content_lower for indicator in _ENGLISH_INDICATORS):
         print(f"❌ 영어 지표 발견 (검증된 피드에서 예상치 못한 상황)")
         return False
     
@@ -1156,7 +1448,7 @@ def extract_grammar_points_from_content(content, difficulty="B2"):
         return []
     
     try:
-        analyzer = SpanishLLMAnalyzer()
+        analyzer = _get_analyzer()
         return analyzer.analyze_article_grammar(content, difficulty)
     except Exception as e:
         print(f"LLM 문법 분석 오류: {e}")
@@ -1180,8 +1472,15 @@ def extract_vocabulary_expressions_from_transcript(transcript, difficulty="B2"):
         print(f"  🎯 분석 난이도: {difficulty}")
         print(f"  📄 입력 콘텐츠 미리보기: {transcript[:200].replace(chr(10), ' ').strip()}...")
         
-        analyzer = SpanishLLMAnalyzer()
-        result = analyzer.analyze_podcast_colloquialisms(transcript, difficulty)
+        # 같은 transcript와 난이도는 이전 분석 결과 재사용 (빈 결과는 API 오류일 수 있어 저장하지 않음)
+        cache_key = _llm_cache_key('colloquialisms', transcript, difficulty)
+        result = llm_cache_get(cache_key)
+        if result:
+            print(f"  ♻️ 캐시된 구어체 분석 결과 사용")
+        else:
+            result = _get_analyzer().analyze_podcast_colloquialisms(transcript, difficulty)
+            if result:
+                llm_cache_put(cache_key, result)
         
         print(f"\n  📊 구어체 분석 최종 결과:")
         print(f"  ✅ 추출된 구어체 표현: {len(result)}개")
@@ -1199,25 +1498,25 @@ def extract_vocabulary_expressions_from_transcript(transcript, difficulty="B2"):
             return []
     except Exception as e:
         print(f"    ❌ LLM 구어체 표현 분석 오류: {e}")
-        print(f"    📝 오류 상세: {traceback.format_exc()}")
+        print(f"    📝 오류 상세:")
+        traceback.print_exc(file=sys.stdout)
         return []
 
 def get_podcast_transcript_or_content(episode_url, episode_title):
     """
     팟캐스트 에피소드 URL에서 transcript나 상세 내용을 가져오기
     원본 URL을 우선적으로 확인 후 다른 소스 검색
+    
+    Returns: (content, apple_url) - apple_url은 Apple Podcasts 설명에서 콘텐츠를 찾은 경우에만 설정
     """
     print(f"    🔍 콘텐츠 검색 시작 - 원본 URL 우선 확인...")
     
-    # 전역 변수 초기화
-    globals()['found_apple_url'] = None
-    
     # 1. 먼저 원본 URL에서 transcript 시도 (가장 우선순위)
     print(f"    📄 원본 URL에서 transcript 추출 시도: {episode_url}")
     content = try_extract_from_url(episode_url, episode_title)
     if content:
         print(f"    ✅ 원본 URL에서 콘텐츠 발견! (길이: {len(content)}자)")
-        return content
+        return content, None
     
     print(f"    ⚠️ 원본 URL에서 콘텐츠를 찾지 못함 - 다른 소스 검색 시작...")
     
@@ -1226,55 +1525,129 @@ def get_podcast_transcript_or_content(episode_url, episode_title):
         print(f"    🌐 Radio Ambulante 공식 웹사이트에서 검색...")
         content = search_radio_ambulante_website(episode_title)
         if content:
-            return content
+            return content, None
     
     # 3. YouTube에서 같은 에피소드 검색
     print(f"    📺 YouTube에서 자막 검색...")
     content = search_youtube_transcript(episode_title)
     if content:
-        return content
+        return content, None
     
     # 4. 팟캐스트 공식 웹사이트에서 쇼노트 검색
     print(f"    📝 팟캐스트 공식 웹사이트에서 쇼노트 검색...")
     content = search_podcast_website(episode_title, episode_url)
     if content:
-        return content
+        return content, None
     
     # 5. Apple Podcasts에서 에피소드 설명 검색
     print(f"    🍎 Apple Podcasts에서 에피소드 설명 검색...")
-    content = search_apple_podcast_description(episode_title)
+    content, apple_url = search_apple_podcast_description(episode_title)
     if content:
-        return content
+        return content, apple_url
     
     print(f"    ❌ 모든 소스에서 콘텐츠를 찾지 못함")
-    return ""
+    return "", None
+
+# transcript 버튼/링크 텍스트
+_TRANSCRIPT_LABEL_RE = re.compile(r'(transcript|transcripción|ver transcripción)', re.IGNORECASE)
+# 위 문구들의 공통 접두사 - HTML 엔티티(transcripci&oacute;n)로 쓰여도 원문에서 찾을 수 있음
+_TRANSCRIPT_HINT_RE = re.compile(r'transcri', re.IGNORECASE)
+
+# onclick 속성 안의 transcript URL 문자열
+_ONCLICK_TRANSCRIPT_URL_RE = re.compile(r'["\']([^"\']*transcript[^"\']*)["\']')
+
+# JavaScript 변수에서 transcript를 찾을 키 이름 (우선순위 순, 키가 이 단어로 끝나면 해당)
+_JS_TRANSCRIPT_KEYS = ('transcript', 'transcription', 'content', 'text')
+
+# 200자 이상의 문자열 값과 그 앞의 키 이름 - 드문 긴 값부터 찾고 키는 값 바로 앞에서만 확인
+_JS_LONG_VALUE_RE = re.compile(r':\s*["\']([^"\']{200,})["\']')
+_JS_KEY_RE = re.compile(r'(\w+)["\']?\s*\Z')
+
+def _find_js_transcript_candidates(page_content):
+    """페이지 소스를 한 번만 훑어 긴 문자열 값들을 _JS_TRANSCRIPT_KEYS 우선순위 순서로 반환"""
+    buckets = {key: [] for key in _JS_TRANSCRIPT_KEYS}
+    for match in _JS_LONG_VALUE_RE.finditer(page_content):
+        start = match.start()
+        key_match = _JS_KEY_RE.search(page_content, max(0, start - 64), start)
+        if not key_match:
+            continue
+        key = key_match.group(1).lower()
+        for name in _JS_TRANSCRIPT_KEYS:
+            if key.endswith(name):
+                buckets[name].append(match.group(1))
+                break
+    return [value for values in buckets.values() for value in values]
+
+def _compile_selectors(*selectors):
+    """CSS 셀렉터들을 미리 컴파일 - (셀렉터, 컴파일된 셀렉터) 튜플 (우선순위 순)"""
+    return tuple((selector, soupsieve.compile(selector)) for selector in selectors)
+
+# transcript 관련 셀렉터들 (우선순위 높음)
+_TRANSCRIPT_SELECTORS = _compile_selectors(
+    '.transcript', '.transcription', '.episode-transcript', '.transcript-content',
+    '#transcript', '#transcription', '[data-transcript]', '[class*="transcript"]'
+)
+
+# 일반적인 콘텐츠 셀렉터들
+_PAGE_CONTENT_SELECTORS = _compile_selectors(
+    '.episode-content', '.episode-description', '.show-notes', '.episode-notes',
+    '.post-content', '.entry-content', '.content', '.description', '.summary',
+    'article', 'main', '.story-content', '.episode-body'
+)
+
+# Radio Ambulante 특화 셀렉터들
+_RADIO_AMBULANTE_SELECTORS = _compile_selectors(
+    '.episode-transcript', '.transcript-content', '.episode-content p',
+    '.story-content p', '.post-content p', '.entry-content p'
+)
 
-def get_found_apple_url():
-    """Apple Podcast 검색에서 발견된 URL 반환"""
-    return globals().get('found_apple_url', None)
+# YouTube 비디오 설명 셀렉터들
+_YOUTUBE_DESCRIPTION_SELECTORS = _compile_selectors('[data-content]', '.description', '#description')
+
+# SpanishPodcast 특화 셀렉터들
+_SPANISHPODCAST_SELECTORS = _compile_selectors(
+    '.episode-content', '.show-notes', '.description', 'article p', '.content p'
+)
+
+# 일반적인 쇼노트 셀렉터들
+_SHOW_NOTES_SELECTORS = _compile_selectors(
+    '.show-notes', '.episode-notes', '.description', '.summary', '.content', 'article', '.post-content'
+)
+
+def _word_alternation(words):
+    """단어 목록 중 하나라도 (대소문자 무시) 포함되는지 한 번에 찾는 정규식"""
+    return re.compile('|'.join(map(re.escape, words)), re.IGNORECASE)
+
+# 스페인어 텍스트 판별 단어 (JavaScript 데이터용 / 문단용)
+_SPANISH_JS_TEXT_RE = _word_alternation(['el ', 'la ', 'es ', 'que ', 'con '])
+_SPANISH_PARAGRAPH_RE = _word_alternation(['el ', 'la ', 'es ', 'que ', 'con ', 'por ', 'para ', 'de ', 'en ', 'un ', 'una '])
+
+# 네비게이션이나 메뉴 텍스트
+_NAV_TEXT_RE = _word_alternation(['inicio', 'contacto', 'sobre', 'menu', 'copyright', '©'])
 
 def try_extract_from_url(episode_url, episode_title):
     """원본 URL에서 transcript 추출 시도"""
     try:
         print(f"    📄 {episode_url} 접속 중...")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(episode_url, headers=headers, timeout=10)
-        if response.status_code != 200:
-            print(f"    ❌ HTTP 오류: {response.status_code}")
+        status, body, page_content = fetch_capped(episode_url, EPISODE_PAGE_MAX_BYTES, HTML_HEADERS)
+        if status != 200:
+            print(f"    ❌ HTTP 오류: {status}")
             return ""
         
         print(f"    📋 페이지 파싱 중...")
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(body, 'lxml')
         
         # 범용 transcript 추출 로직
         print(f"    🔍 페이지에서 transcript/콘텐츠 추출 중...")
         
         # 1. transcript 관련 버튼이나 링크에서 실제 transcript URL 찾기
         print(f"    🔍 transcript 버튼/링크에서 URL 추출 시도...")
-        transcript_buttons = soup.find_all(['a', 'button'], string=re.compile(r'(transcript|transcripción|ver transcripción)', re.IGNORECASE))
+        # 페이지 원문에 transcript 문구가 아예 없으면 모든 a/button 텍스트를 검사할 필요 없음
+        has_transcript_hint = _TRANSCRIPT_HINT_RE.search(page_content) is not None
+        if has_transcript_hint:
+            transcript_buttons = soup.find_all(['a', 'button'], string=_TRANSCRIPT_LABEL_RE)
+        else:
+            transcript_buttons = []
         for button in transcript_buttons:
             href = button.get('href')
             onclick = button.get('onclick', '')
@@ -1283,24 +1656,21 @@ def try_extract_from_url(episode_url, episode_title):
             # 가능한 transcript URL들
             possible_urls = []
             if href and not href.startswith('#'):
-                from urllib.parse import urljoin
                 # 상대 URL을 절대 URL로 변환
                 absolute_url = urljoin(episode_url, href)
                 possible_urls.append(absolute_url)
                 print(f"    🔗 transcript 링크 발견: {href} → {absolute_url}")
             
             if data_url:
-                from urllib.parse import urljoin
                 absolute_data_url = urljoin(episode_url, data_url)
                 possible_urls.append(absolute_data_url)
                 print(f"    🔗 data-url 발견: {data_url} → {absolute_data_url}")
             
             # onclick에서 URL 추출
             if onclick:
-                url_match = re.search(r'["\']([^"\']*transcript[^"\']*)["\']', onclick)
+                url_match = _ONCLICK_TRANSCRIPT_URL_RE.search(onclick)
                 if url_match:
                     onclick_url = url_match.group(1)
-                    from urllib.parse import urljoin
                     absolute_onclick_url = urljoin(episode_url, onclick_url)
                     possible_urls.append(absolute_onclick_url)
                     print(f"    🔗 onclick URL 발견: {onclick_url} → {absolute_onclick_url}")
@@ -1309,12 +1679,12 @@ def try_extract_from_url(episode_url, episode_title):
             for transcript_url in possible_urls:
                 try:
                     print(f"    🔍 transcript URL 시도: {transcript_url}")
-                    transcript_response = requests.get(transcript_url, headers=headers, timeout=10)
-                    if transcript_response.status_code == 200:
-                        transcript_content = transcript_response.text.strip()
+                    transcript_status, _, transcript_content = fetch_capped(transcript_url, EPISODE_PAGE_MAX_BYTES, HTML_HEADERS)
+                    if transcript_status == 200:
+                        transcript_content = transcript_content.strip()
                         # HTML인 경우 텍스트만 추출
                         if transcript_content.startswith('<'):
-                            transcript_soup = BeautifulSoup(transcript_content, 'html.parser')
+                            transcript_soup = BeautifulSoup(transcript_content, 'lxml')
                             transcript_content = transcript_soup.get_text().strip()
                         
                         if len(transcript_content) > 100:
@@ -1323,86 +1693,53 @@ def try_extract_from_url(episode_url, episode_title):
                         else:
                             print(f"    ⚠️ transcript 내용이 너무 짧음 (길이: {len(transcript_content)}자)")
                     else:
-                        print(f"    ❌ HTTP 오류: {transcript_response.status_code}")
+                        print(f"    ❌ HTTP 오류: {transcript_status}")
                 except Exception as e:
                     print(f"    ❌ transcript URL 접근 실패: {e}")
                     continue
         
         # 2. 페이지 소스에서 JavaScript 변수나 JSON 데이터로 embedded된 transcript 찾기
         print(f"    🔍 JavaScript/JSON 데이터에서 transcript 검색...")
-        page_content = response.text
-        
-        # JavaScript 변수에서 transcript 추출 패턴들
-        js_patterns = [
-            r'transcript["\']?\s*:\s*["\']([^"\']{200,})["\']',
-            r'transcription["\']?\s*:\s*["\']([^"\']{200,})["\']',
-            r'content["\']?\s*:\s*["\']([^"\']{200,})["\']',
-            r'text["\']?\s*:\s*["\']([^"\']{200,})["\']'
-        ]
         
-        for pattern in js_patterns:
-            matches = re.findall(pattern, page_content, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                # HTML 엔티티 디코딩 및 정리
-                clean_text = match.replace('\\n', '\n').replace('\\t', ' ').replace('\\"', '"')
-                if len(clean_text) > 200 and any(word in clean_text.lower() for word in ['el ', 'la ', 'es ', 'que ', 'con ']):
-                    print(f"    ✅ JavaScript 데이터에서 스페인어 콘텐츠 발견! (길이: {len(clean_text)}자)")
-                    return clean_text[:3000]
+        for match in _find_js_transcript_candidates(page_content):
+            # HTML 엔티티 디코딩 및 정리
+            clean_text = match.replace('\\n', '\n').replace('\\t', ' ').replace('\\"', '"')
+            if len(clean_text) > 200 and _SPANISH_JS_TEXT_RE.search(clean_text):
+                print(f"    ✅ JavaScript 데이터에서 스페인어 콘텐츠 발견! (길이: {len(clean_text)}자)")
+                return clean_text[:3000]
         
         # 3. 포괄적인 CSS 셀렉터로 콘텐츠 추출
         print(f"    🔍 CSS 셀렉터로 콘텐츠 추출...")
         
-        # transcript 관련 셀렉터들 (우선순위 높음)
-        priority_selectors = [
-            '.transcript', '.transcription', '.episode-transcript', '.transcript-content',
-            '#transcript', '#transcription', '[data-transcript]', '[class*="transcript"]'
-        ]
-        
-        # 일반적인 콘텐츠 셀렉터들
-        content_selectors = [
-            '.episode-content', '.episode-description', '.show-notes', '.episode-notes',
-            '.post-content', '.entry-content', '.content', '.description', '.summary',
-            'article', 'main', '.story-content', '.episode-body'
-        ]
-        
-        # 우선순위 셀렉터들 먼저 시도
-        for selector in priority_selectors:
-            elements = soup.select(selector)
+        # 우선순위 셀렉터들 먼저 시도 (모두 'transcri'를 포함하므로 페이지에 그 문구가 없으면 생략)
+        priority_selectors = _TRANSCRIPT_SELECTORS if has_transcript_hint else ()
+        for selector, compiled in priority_selectors:
+            elements = compiled.select(soup)
             if elements:
-                content = ' '.join([elem.get_text().strip() for elem in elements])
+                content = join_texts(element_texts(elements), 3000)
                 if len(content) > 100:
                     print(f"    ✅ 우선순위 셀렉터에서 콘텐츠 발견! (셀렉터: {selector}, 길이: {len(content)}자)")
                     return content[:3000]
         
         # 일반 콘텐츠 셀렉터들 시도
-        for selector in content_selectors:
-            elements = soup.select(selector)
+        for _, compiled in _PAGE_CONTENT_SELECTORS:
+            elements = compiled.select(soup)
             if elements:
-                content = ' '.join([elem.get_text().strip() for elem in elements])
+                content = join_texts(element_texts(elements), 3000)
                 if len(content) > 200:  # 일반 콘텐츠는 더 긴 텍스트만 허용
                     print(f"    ✅ 일반 셀렉터에서 콘텐츠 발견! (길이: {len(content)}자)")
                     return content[:3000]
         
         # 4. 페이지의 모든 문단에서 스페인어 콘텐츠 필터링
         print(f"    🔍 페이지 전체에서 스페인어 콘텐츠 검색...")
-        all_paragraphs = soup.find_all('p')
-        spanish_content = []
-        
-        for p in all_paragraphs:
-            text = p.get_text().strip()
-            if len(text) > 30:  # 너무 짧은 텍스트 제외
-                # 스페인어 패턴 확인 (더 포괄적)
-                spanish_patterns = ['el ', 'la ', 'es ', 'que ', 'con ', 'por ', 'para ', 'de ', 'en ', 'un ', 'una ']
-                if any(pattern in text.lower() for pattern in spanish_patterns):
-                    # 네비게이션이나 메뉴 텍스트 제외
-                    if not any(nav_word in text.lower() for nav_word in ['inicio', 'contacto', 'sobre', 'menu', 'copyright', '©']):
-                        spanish_content.append(text)
-        
-        if spanish_content:
-            content = ' '.join(spanish_content)
-            if len(content) > 200:
-                print(f"    ✅ 페이지에서 스페인어 콘텐츠 발견! (길이: {len(content)}자)")
-                return content[:3000]
+        # 너무 짧은 텍스트(30자 이하) 제외, 스페인어 패턴이 있고 네비게이션/메뉴 텍스트가 아닌 문단만 사용
+        spanish_content = (text for text in element_texts(soup.find_all('p'), 31)
+                           if _SPANISH_PARAGRAPH_RE.search(text) and not _NAV_TEXT_RE.search(text))
+        
+        content = join_texts(spanish_content, 3000)
+        if len(content) > 200:
+            print(f"    ✅ 페이지에서 스페인어 콘텐츠 발견! (길이: {len(content)}자)")
+            return content[:3000]
         
         print(f"    ❌ 원본 URL에서 충분한 콘텐츠를 찾지 못함")
         return ""
@@ -1415,9 +1752,7 @@ def search_radio_ambulante_website(episode_title):
     """Radio Ambulante 공식 웹사이트에서 에피소드 검색"""
     try:
         # 에피소드 제목에서 슬러그 생성
-        import re
-        title_clean = re.sub(r'[^\w\s-]', '', episode_title.lower())
-        slug = re.sub(r'[-\s]+', '-', title_clean).strip('-')
+        slug = make_slug(episode_title.lower())
         
         # 여러 가능한 URL 패턴 시도
         possible_urls = [
@@ -1428,28 +1763,14 @@ def search_radio_ambulante_website(episode_title):
         
         for url in possible_urls:
             try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                
-                response = requests.get(url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                status, body, _ = fetch_capped(url, EPISODE_PAGE_MAX_BYTES, HTML_HEADERS)
+                if status == 200:
+                    soup = BeautifulSoup(body, 'lxml')
                     
-                    # Radio Ambulante 특화 셀렉터들
-                    selectors = [
-                        '.episode-transcript',
-                        '.transcript-content',
-                        '.episode-content p',
-                        '.story-content p',
-                        '.post-content p',
-                        '.entry-content p'
-                    ]
-                    
-                    for selector in selectors:
-                        elements = soup.select(selector)
+                    for _, compiled in _RADIO_AMBULANTE_SELECTORS:
+                        elements = compiled.select(soup)
                         if elements:
-                            content = ' '.join([elem.get_text().strip() for elem in elements])
+                            content = join_texts(element_texts(elements), 3000)
                             if len(content) > 200:
                                 print(f"    ✅ Radio Ambulante 웹사이트에서 콘텐츠 발견 (길이: {len(content)}자)")
                                 return content[:3000]
@@ -1463,6 +1784,9 @@ def search_radio_ambulante_website(episode_title):
         print(f"    ❌ Radio Ambulante 웹사이트 검색 오류: {e}")
         return ""
 
+# YouTube 검색 결과 페이지의 비디오 ID
+_VIDEO_ID_RE = re.compile(r'"videoId":"([^"]+)"')
+
 def search_youtube_transcript(episode_title):
     """YouTube에서 같은 에피소드의 자막 검색"""
     try:
@@ -1470,35 +1794,25 @@ def search_youtube_transcript(episode_title):
         search_query = f"{episode_title} transcript"
         search_url = f"https://www.youtube.com/results?search_query={urllib.parse.quote(search_query)}"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(search_url, headers=headers, timeout=10)
+        response = get_session().get(search_url, headers=HTML_HEADERS, timeout=10)
         if response.status_code == 200:
             # YouTube 검색 결과에서 비디오 ID 추출
-            video_id_pattern = r'"videoId":"([^"]+)"'
-            video_ids = re.findall(video_id_pattern, response.text)
+            # 첫 번째 비디오 ID만 사용하므로 처음 일치하는 곳에서 검색 종료
+            video_match = _VIDEO_ID_RE.search(response.text)
             
-            if video_ids:
+            if video_match:
                 # 첫 번째 비디오의 설명 가져오기 시도
-                video_url = f"https://www.youtube.com/watch?v={video_ids[0]}"
-                video_response = requests.get(video_url, headers=headers, timeout=10)
+                video_url = f"https://www.youtube.com/watch?v={video_match.group(1)}"
+                video_response = get_session().get(video_url, headers=HTML_HEADERS, timeout=10)
                 
                 if video_response.status_code == 200:
-                    soup = BeautifulSoup(video_response.content, 'html.parser')
+                    soup = BeautifulSoup(video_response.content, 'lxml')
                     
                     # 비디오 설명 추출
-                    description_selectors = [
-                        '[data-content]',
-                        '.description',
-                        '#description'
-                    ]
-                    
-                    for selector in description_selectors:
-                        elements = soup.select(selector)
+                    for _, compiled in _YOUTUBE_DESCRIPTION_SELECTORS:
+                        elements = compiled.select(soup)
                         if elements:
-                            content = ' '.join([elem.get_text().strip() for elem in elements])
+                            content = join_texts(element_texts(elements), 3000)
                             if len(content) > 200:
                                 print(f"    ✅ YouTube 에피소드 설명 발견 (길이: {len(content)}자)")
                                 return content[:3000]
@@ -1541,27 +1855,14 @@ def search_spanishpodcast_website(episode_title):
         if episode_num:
             episode_url = f"{base_url}/podcasts/{episode_num}.html"
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(episode_url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            status, body, _ = fetch_capped(episode_url, EPISODE_PAGE_MAX_BYTES, HTML_HEADERS)
+            if status == 200:
+                soup = BeautifulSoup(body, 'lxml')
                 
-                # SpanishPodcast 특화 셀렉터들
-                selectors = [
-                    '.episode-content',
-                    '.show-notes',
-                    '.description',
-                    'article p',
-                    '.content p'
-                ]
-                
-                for selector in selectors:
-                    elements = soup.select(selector)
+                for _, compiled in _SPANISHPODCAST_SELECTORS:
+                    elements = compiled.select(soup)
                     if elements:
-                        content = ' '.join([elem.get_text().strip() for elem in elements])
+                        content = join_texts(element_texts(elements), 3000)
                         if len(content) > 200:
                             print(f"    ✅ SpanishPodcast 웹사이트에서 쇼노트 발견 (길이: {len(content)}자)")
                             return content[:3000]
@@ -1589,29 +1890,14 @@ def search_espanolistos_website(episode_title):
 def search_general_podcast_website(episode_url):
     """일반적인 팟캐스트 웹사이트에서 쇼노트 검색"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(episode_url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+        status, body, _ = fetch_capped(episode_url, EPISODE_PAGE_MAX_BYTES, HTML_HEADERS)
+        if status == 200:
+            soup = BeautifulSoup(body, 'lxml')
             
-            # 일반적인 쇼노트 셀렉터들
-            selectors = [
-                '.show-notes',
-                '.episode-notes',
-                '.description',
-                '.summary',
-                '.content',
-                'article',
-                '.post-content'
-            ]
-            
-            for selector in selectors:
-                elements = soup.select(selector)
+            for _, compiled in _SHOW_NOTES_SELECTORS:
+                elements = compiled.select(soup)
                 if elements:
-                    content = ' '.join([elem.get_text().strip() for elem in elements])
+                    content = join_texts(element_texts(elements), 3000)
                     if len(content) > 200:
                         print(f"    ✅ 일반 팟캐스트 웹사이트에서 콘텐츠 발견 (길이: {len(content)}자)")
                         return content[:3000]
@@ -1623,24 +1909,11 @@ def search_general_podcast_website(episode_url):
         return ""
 
 def search_apple_podcast_description(episode_title):
-    """Apple Podcasts에서 에피소드 설명 검색하고 URL도 반환"""
+    """Apple Podcasts에서 에피소드 설명 검색하고 URL도 반환 - (description, track_view_url)"""
     try:
         # iTunes Search API를 사용하여 에피소드 설명 가져오기
-        search_term = episode_title
-        encoded_term = urllib.parse.quote(search_term)
-        search_url = f"https://itunes.apple.com/search?term={encoded_term}&media=podcast&entity=podcastEpisode&limit=5"
-        
-        print(f"    🔍 iTunes Search API 호출: {search_url}")
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(search_url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            results = data.get('results', [])
-            
+        results = _itunes_search(episode_title, limit=5)
+        if results:
             for result in results:
                 track_name = result.get('trackName', '')
                 description = result.get('description', '')
@@ -1651,18 +1924,36 @@ def search_apple_podcast_description(episode_title):
                     if description and len(description) > 100:
                         print(f"    ✅ iTunes에서 에피소드 설명 발견 (길이: {len(description)}자)")
                         
-                        # 전역 변수에 발견된 Apple URL 저장
                         if track_view_url:
-                            globals()['found_apple_url'] = track_view_url
-                            print(f"    🍎 Apple Podcast URL 저장: {track_view_url}")
+                            print(f"    🍎 Apple Podcast URL 발견: {track_view_url}")
                         
-                        return description[:3000]
+                        return description[:3000], track_view_url or None
         
-        return ""
+        return "", None
         
     except Exception as e:
         print(f"    ❌ iTunes Search 오류: {e}")
-        return ""
+        return "", None
+
+# 독해 소스(calculate_schedule.py의 reading_source) → 기사 RSS 피드 URL
+ARTICLE_FEED_URLS = {
+    "20minutos": "https://www.20minutos.es/rss/",
+    "El País 단신": "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/portada",
+    "El País 사설": "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/section/opinion",
+    "El Mundo": "https://e00-elmundo.uecdn.es/elmundo/rss/portada.xml",
+    "ABC": "https://www.abc.es/rss/feeds/abc_EspanaEspana.xml",
+}
+
+def resolve_article_feed_url(reading_source):
+    """독해 소스에 해당하는 기사 RSS 피드 URL"""
+    feed_url = ARTICLE_FEED_URLS.get(reading_source)
+    if feed_url:
+        return feed_url
+    # 표에 없는 El País 표기는 사설 여부로 구분
+    if "El País" in reading_source:
+        return ARTICLE_FEED_URLS["El País 사설" if "사설" in reading_source else "El País 단신"]
+    # 기본값
+    return ARTICLE_FEED_URLS["20minutos"]
 
 def main():
     # 환경변수에서 설정값 가져오기
@@ -1728,38 +2019,32 @@ def main():
     print(f"   Apple: {podcast_apple_base}")
     print(f"   ✅ 100% 스페인어 콘텐츠 보장됨")
 
+    # 기사 피드, 팟캐스트 피드, 백업 피드를 한꺼번에 요청 (결과는 사용하는 곳에서 기다림)
+    feed_url = resolve_article_feed_url(reading_source)
+    backup_feeds = [(info["rss"], name, info["apple"])
+                    for name, info in verified_spanish_feeds.items() if name != selected_podcast]
+    feed_pool = ThreadPoolExecutor(max_workers=min(2 + len(backup_feeds), FEED_FETCH_WORKERS))
+    article_feed_future = feed_pool.submit(fetch_feed, feed_url)
+    podcast_feed_future = feed_pool.submit(fetch_feed, podcast_rss)
+    backup_feed_futures = {url: feed_pool.submit(fetch_feed, url) for url, _, _ in backup_feeds}
+    feed_pool.shutdown(wait=False)
+
     # 기사 수집 및 실제 내용 분석
     try:
-        if reading_source == "20minutos":
-            feed_url = "https://www.20minutos.es/rss/"
-        elif "El País" in reading_source:
-            if "사설" in reading_source:
-                feed_url = "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/section/opinion"
-            else:
-                feed_url = "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/portada"
-        elif reading_source == "El Mundo":
-            feed_url = "https://e00-elmundo.uecdn.es/elmundo/rss/portada.xml"
-        elif reading_source == "ABC":
-            feed_url = "https://www.abc.es/rss/feeds/abc_EspanaEspana.xml"
-        else:
-            # 기본값
-            feed_url = "https://www.20minutos.es/rss/"
-        
         print(f"RSS 피드에서 기사 정보 수집 중: {feed_url}")
-        feed = feedparser.parse(feed_url)
+        feed = article_feed_future.result()
         
         if feed.entries:
             # 대안 모드에서는 여러 기사 중에서 선택
             entry_index = 0
-            if force_alternative:
-                # 대안 모드에서는 두 번째 또는 세 번째 기사 시도
-                import random
-                entry_index = min(random.randint(1, 3), len(feed.entries) - 1)
+            if force_alternative and len(feed.entries) > 1:
+                # 대안 모드에서는 두 번째~네 번째 기사 중 하나 시도
+                entry_index = random.randrange(1, min(4, len(feed.entries)))
                 print(f"대안 모드: {entry_index + 1}번째 기사 선택")
             
             latest = feed.entries[entry_index]
             article_url = latest.link
-            clean_title = latest.title.replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+            clean_title = unescape(latest.title)
             
             print(f"기사 URL 접속 중: {article_url}")
             # 실제 기사 내용 가져오기
@@ -1806,13 +2091,13 @@ def main():
             
     except Exception as e:
         print(f"기사 수집 오류: {e}")
-        import traceback
-        print(f"상세 오류: {traceback.format_exc()}")
+        print(f"상세 오류:")
+        traceback.print_exc(file=sys.stdout)
 
     # 팟캐스트 에피소드 수집
     try:
         print(f"팟캐스트 RSS 피드 수집 중: {podcast_rss}")
-        feed = feedparser.parse(podcast_rss)
+        feed = podcast_feed_future.result()
         
         print(f"피드 파싱 결과:")
         print(f"- 피드 제목: {feed.feed.get('title', '제목 없음')}")
@@ -1827,17 +2112,11 @@ def main():
             print(f"⚠️  메인 RSS 피드 사용 불가 (상태: {getattr(feed, 'status', 'N/A')}, 에피소드: {len(feed.entries)})")
             print("🔄 다른 검증된 스페인어 피드들을 시도합니다...")
             
-            # 현재 선택된 피드를 제외한 다른 검증된 스페인어 피드들
-            alternative_feeds = []
-            for name, info in verified_spanish_feeds.items():
-                if name != selected_podcast:  # 현재 피드 제외
-                    alternative_feeds.append((info["rss"], name, info["apple"]))
-            
-            # 백업 피드들 시도
-            for backup_url, backup_podcast_name, backup_apple_base in alternative_feeds:
+            # 백업 피드들 시도 (현재 선택된 피드를 제외한 다른 검증된 스페인어 피드들 - 이미 요청해 둠)
+            for backup_url, backup_podcast_name, backup_apple_base in backup_feeds:
                 try:
                     print(f"🔄 백업 피드 시도: {backup_podcast_name}")
-                    backup_feed = feedparser.parse(backup_url)
+                    backup_feed = backup_feed_futures[backup_url].result()
                     
                     if backup_feed.entries:
                         print(f"✅ {backup_podcast_name}에서 에피소드 발견! (개수: {len(backup_feed.entries)})")
@@ -1849,62 +2128,17 @@ def main():
                         print(f"  제목: {latest.title}")
                         print(f"  RSS URL: {latest.link}")
                         
-                        episode_number = extract_episode_number(latest.title)
-                        duration = extract_duration_from_feed(latest)
-                        topic = extract_topic_keywords(latest.title, latest.get('summary', ''))
-                        
-                        episode_link = latest.link
-                        
-                        # Radio Ambulante인 경우 실제 웹사이트 URL 시도
-                        if 'Radio Ambulante' in backup_podcast_name:
-                            radio_ambulante_url = extract_radio_ambulante_url(latest)
-                            if radio_ambulante_url:
-                                print(f"  Radio Ambulante 웹사이트 URL: {radio_ambulante_url}")
-                                episode_link = radio_ambulante_url
-                            else:
-                                print(f"  Radio Ambulante 웹사이트 URL 추출 실패, RSS URL 사용")
-                        
-                        # Apple Podcasts 링크 생성
-                        apple_link = generate_apple_podcast_link(backup_podcast_name, backup_apple_base, episode_link, episode_number, latest.title)
-                        
-                        # 최종 URL 결정
-                        final_episode_url = episode_link
-                        if 'Radio Ambulante' in backup_podcast_name:
-                            if apple_link != backup_apple_base and validate_url(apple_link):
-                                final_episode_url = apple_link
-                            else:
-                                final_episode_url = episode_link
-                                apple_link = backup_apple_base
-                        else:
-                            if not validate_url(episode_link):
-                                final_episode_url = apple_link if validate_url(apple_link) else backup_apple_base
-                            if not validate_url(apple_link):
-                                apple_link = backup_apple_base
-                        
-                        # 백업 피드 난이도 분석
-                        backup_summary = latest.get('summary', '')
-                        backup_difficulty = analyze_text_difficulty(backup_summary) if backup_summary else "B2"
-                        
                         # 백업 피드 초기 데이터 생성
-                        backup_podcast_data = {
-                            'title': latest.title,
-                            'url': final_episode_url,
-                            'apple_link': apple_link,
-                            'published': latest.get('published', ''),
-                            'duration': duration,
-                            'episode_number': episode_number or 'N/A',
-                            'topic': topic,
-                            'podcast_name': f"{backup_podcast_name} (백업)",
-                            'summary': latest.get('summary', '')[:200],
-                            'difficulty': backup_difficulty
-                        }
+                        backup_podcast_data = build_podcast_data(latest, backup_podcast_name, backup_apple_base,
+                                                                 f"{backup_podcast_name} (백업)")
+                        backup_difficulty = backup_podcast_data['difficulty']
                         
                         print(f"✅ 백업 피드 성공! 사용된 피드: {backup_podcast_name}")
                         print(f"   에피소드: {latest.title}")
                         
                         # 🎯 백업 피드에서도 구어체 표현 분석 수행
                         print(f"\n🔍 백업 피드 에피소드 구어체 표현 분석...")
-                        backup_transcript = get_podcast_transcript_or_content(final_episode_url, latest.title)
+                        backup_transcript, _ = get_podcast_transcript_or_content(backup_podcast_data['url'], latest.title)
                         
                         backup_expressions = []
                         if backup_transcript:
@@ -1962,8 +2196,7 @@ def main():
             # 대안 모드에서는 다른 에피소드 선택
             episode_index = 0
             if force_alternative and len(feed.entries) > 1:
-                import random
-                episode_index = min(random.randint(1, 3), len(feed.entries) - 1)
+                episode_index = random.randrange(1, min(4, len(feed.entries)))
                 print(f"🔄 대안 모드: {episode_index + 1}번째 에피소드 선택")
             
             latest = feed.entries[episode_index]
@@ -1971,55 +2204,9 @@ def main():
             print(f"- 링크: {latest.link}")
             print(f"- 발행일: {latest.get('published', 'N/A')}")
             
-            episode_number = extract_episode_number(latest.title)
-            duration = extract_duration_from_feed(latest)
-            topic = extract_topic_keywords(latest.title, latest.get('summary', ''))
-            
-            episode_link = latest.link
-            
-            # Radio Ambulante인 경우 실제 웹사이트 URL 시도
-            if 'Radio Ambulante' in podcast_name:
-                radio_ambulante_url = extract_radio_ambulante_url(latest)
-                if radio_ambulante_url:
-                    print(f"  Radio Ambulante 웹사이트 URL: {radio_ambulante_url}")
-                    episode_link = radio_ambulante_url
-                else:
-                    print(f"  Radio Ambulante 웹사이트 URL 추출 실패, RSS URL 사용")
-            
-            # Apple Podcasts 링크 생성
-            apple_link = generate_apple_podcast_link(podcast_name, podcast_apple_base, episode_link, episode_number, latest.title)
-            
-            # 최종 URL 결정
-            final_episode_url = episode_link
-            if 'Radio Ambulante' in podcast_name:
-                if apple_link != podcast_apple_base and validate_url(apple_link):
-                    final_episode_url = apple_link
-                else:
-                    final_episode_url = episode_link
-                    apple_link = podcast_apple_base
-            else:
-                if not validate_url(episode_link):
-                    final_episode_url = apple_link if validate_url(apple_link) else podcast_apple_base
-                if not validate_url(apple_link):
-                    apple_link = podcast_apple_base
-            
-            # 팟캐스트 난이도 분석
-            episode_summary = latest.get('summary', '')
-            podcast_difficulty = analyze_text_difficulty(episode_summary) if episode_summary else "B2"
-            
             # 초기 팟캐스트 데이터 생성
-            initial_podcast_data = {
-                'title': latest.title,
-                'url': final_episode_url,
-                'apple_link': apple_link,
-                'published': latest.get('published', ''),
-                'duration': duration,
-                'episode_number': episode_number or 'N/A',
-                'topic': topic,
-                'podcast_name': podcast_name,
-                'summary': latest.get('summary', '')[:200],
-                'difficulty': podcast_difficulty
-            }
+            initial_podcast_data = build_podcast_data(latest, podcast_name, podcast_apple_base, podcast_name)
+            podcast_difficulty = initial_podcast_data['difficulty']
             
             print(f"✅ 메인 피드에서 에피소드 선택 완료!")
             
@@ -2033,7 +2220,11 @@ def main():
                 expressions = []
             else:
                 print(f"\n🔍 구어체 표현 분석 시작...")
-                transcript_content = get_podcast_transcript_or_content(final_episode_url, latest.title)
+                transcript_content, found_apple_url = get_podcast_transcript_or_content(initial_podcast_data['url'], latest.title)
+                
+                # 메모 작성 시 구어체 표현을 재사용하므로 찾은 Apple URL도 함께 저장
+                if found_apple_url:
+                    initial_podcast_data['found_apple_url'] = found_apple_url
                 
                 expressions = []
                 if transcript_content:
@@ -2090,28 +2281,49 @@ def main():
             
     except Exception as e:
         print(f"팟캐스트 수집 오류: {e}")
-        import traceback
-        print(f"상세 오류: {traceback.format_exc()}")
+        print(f"상세 오류:")
+        traceback.print_exc(file=sys.stdout)
+
+    # 상세 메모는 문법 분석(LLM)을 거치므로 종류별로 한 번만 생성해서 두 출력에 함께 사용
+    # (팟캐스트 메모는 더 정확한 Apple URL을 찾으면 apple_link를 바꾸므로 출력 줄과 같은 순서로 필요할 때 생성)
+    memos = {}
+    def detailed_memo(content_type, data):
+        if content_type not in memos:
+            memos[content_type] = create_detailed_memo(content_type, data, weekday_name)
+        return memos[content_type]
 
     # 학습 자료 정보를 환경변수로 출력
     # 대안 모드에서는 GITHUB_OUTPUT이 없을 수 있으므로 조건부 처리
     if 'GITHUB_OUTPUT' in os.environ:
         try:
-            with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
-                if article_data:
-                    f.write(f"article_title={article_data['title']}\n")
-                    f.write(f"article_url={article_data['url']}\n")
-                    f.write(f"article_category={article_data['category']}\n")
-                    f.write(f"article_difficulty={article_data['difficulty']}\n")  # 동적 난이도 출력
-                    f.write(f"article_memo={create_detailed_memo('article', article_data, weekday_name)}\n")
-                
-                if podcast_data:
-                    f.write(f"podcast_title={podcast_data['title']}\n")
-                    f.write(f"podcast_url={podcast_data['url']}\n")
-                    f.write(f"podcast_apple={podcast_data['apple_link']}\n")
-                    f.write(f"podcast_duration={podcast_data['duration']}\n")
-                    f.write(f"podcast_topic={podcast_data['topic']}\n")
-                    f.write(f"podcast_memo={create_detailed_memo('podcast', podcast_data, weekday_name)}\n")
+            lines = []
+            if article_data:
+                lines += [
+                    f"article_title={article_data['title']}",
+                    f"article_url={article_data['url']}",
+                    f"article_category={article_data['category']}",
+                    f"article_difficulty={article_data['difficulty']}",  # 동적 난이도 출력
+                    f"article_memo={detailed_memo('article', article_data)}",
+                ]
+            
+            if podcast_data:
+                lines += [
+                    f"podcast_title={podcast_data['title']}",
+                    f"podcast_url={podcast_data['url']}",
+                    f"podcast_apple={podcast_data['apple_link']}",
+                    f"podcast_duration={podcast_data['duration']}",
+                    f"podcast_topic={podcast_data['topic']}",
+                    f"podcast_memo={detailed_memo('podcast', podcast_data)}",
+                ]
+            
+            # 한 번의 write로 기록 (중간에 중단되어도 일부 줄만 남지 않도록)
+            if lines:
+                payload = "\n".join(lines) + "\n"
+                fd = os.open(os.environ['GITHUB_OUTPUT'], os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, payload.encode('utf-8'))
+                finally:
+                    os.close(fd)
         except Exception as e:
             print(f"GitHub Output 파일 쓰기 오류: {e}")
     
@@ -2123,7 +2335,7 @@ def main():
             print(f'ARTICLE_URL="{article_data["url"]}"')
             print(f'ARTICLE_CATEGORY="{article_data["category"]}"')
             print(f'ARTICLE_DIFFICULTY="{article_data["difficulty"]}"')
-            print(f'ARTICLE_MEMO="{create_detailed_memo("article", article_data, weekday_name)}"')
+            print(f'ARTICLE_MEMO="{detailed_memo("article", article_data)}"')
         
         if podcast_data:
             print(f'PODCAST_TITLE="{podcast_data["title"]}"')
@@ -2131,7 +2343,7 @@ def main():
             print(f'PODCAST_APPLE="{podcast_data["apple_link"]}"')
             print(f'PODCAST_DURATION="{podcast_data["duration"]}"')
             print(f'PODCAST_TOPIC="{podcast_data["topic"]}"')
-            print(f'PODCAST_MEMO="{create_detailed_memo("podcast", podcast_data, weekday_name)}"')
+            print(f'PODCAST_MEMO="{detailed_memo("podcast", podcast_data)}"')
         print("=========================================")
 
     # 단일 모드에서는 하나만 수집 후 즉시 종료
@@ -2140,11 +2352,11 @@ def main():
     
     if single_episode_mode and podcast_data:
         print("🔄 단일 에피소드 모드: 팟캐스트 수집 완료 후 즉시 종료")
-        return
+        return 0
     
     if single_article_mode and article_data:
         print("🔄 단일 기사 모드: 기사 수집 완료 후 즉시 종료")
-        return
+        return 0
 
     print("학습 자료 수집 완료!")
     if article_data:
@@ -2163,5 +2375,30 @@ def main():
         print(f"   RSS URL: {podcast_rss}")
         print(f"   팟캐스트명: {podcast_name}")
 
+    # 종료 코드: 요청한 자료를 수집했으면 0, rate limit 때문에 못 찾았으면 42, 그 외 실패는 1
+    # 단일 모드(대안 검색 프로브)에서는 해당 자료만, 그 외에는 하나라도 수집했으면 성공
+    if single_article_mode:
+        collected = article_data
+    elif single_episode_mode:
+        collected = podcast_data
+    else:
+        collected = article_data or podcast_data
+    if collected:
+        return 0
+
+    # 워크플로의 수집 단계(대안 모드가 아닌 실행)는 예전처럼 0으로 종료 - 빈 출력은 다음 단계에서 처리
+    if not force_alternative:
+        return 0
+
+    retry_after = rate_limit_retry_after()
+    if retry_after is not None:
+        print(f"⏳ 요청 제한(429)으로 수집 실패 - Retry-After: {retry_after}초")
+        retry_after_file = os.environ.get('RETRY_AFTER_FILE')
+        if retry_after_file:
+            with open(retry_after_file, 'w') as f:
+                f.write(str(retry_after))
+        return RATE_LIMITED_EXIT_CODE
+    return 1
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -3,7 +3,6 @@
 Create Notion pages for collected Spanish learning materials.
 """
 import os
-import requests
 import json
 import sys
 import subprocess
@@ -11,10 +10,12 @@ import time
 import re
 from datetime import datetime
 
+from http_cache import get_session
+
 def get_database_properties(database_id, headers):
     """데이터베이스의 속성 정보를 조회"""
     try:
-        response = requests.get(
+        response = get_session().get(
             f'https://api.notion.com/v1/databases/{database_id}',
             headers=headers
         )
@@ -357,7 +358,7 @@ def create_notion_page(title, url, content_type, memo, category="", duration="",
     }
 
     try:
-        response = requests.post(
+        response = get_session().post(
             'https://api.notion.com/v1/pages',
             headers=headers,
             json=data
@@ -416,7 +417,7 @@ def check_duplicate_page(title, content_type):
             "page_size": 20
         }
         
-        response = requests.post(
+        response = get_session().post(
             f'https://api.notion.com/v1/databases/{DATABASE_ID}/query',
             headers=headers,
             json=search_payload
@@ -477,7 +478,7 @@ def simple_duplicate_check(title, headers, database_id):
             "page_size": 10
         }
         
-        response = requests.post(
+        response = get_session().post(
             f'https://api.notion.com/v1/databases/{database_id}/query',
             headers=headers,
             json=search_payload
@@ -715,14 +716,12 @@ def find_and_register_alternative_podcast():
                                 podcast_memo = new_podcast_data.get('PODCAST_MEMO', '')
                                 if '구어체:' in podcast_memo:
                                     # 구어체 표현 패턴 찾기
-                                    import re
-                                    colloquial_pattern = r'🎯\s*[A-C][12]\+?\s*구어체:\s*([^🤖]+)'
-                                    match = re.search(colloquial_pattern, podcast_memo)
+                                    match = _COLLOQUIAL_MEMO_RE.search(podcast_memo)
                                     if match:
                                         colloquial_text = match.group(1).strip()
                                         if '분석 결과 0개 발견' not in colloquial_text and '0개 발견' not in colloquial_text:
                                             # | 또는 , 로 구분된 표현들 개수 계산
-                                            expressions = re.split(r'\s*[\|,]\s*', colloquial_text)
+                                            expressions = _EXPRESSION_SEPARATOR_RE.split(colloquial_text)
                                             valid_expressions = [expr.strip() for expr in expressions if expr.strip() and len(expr.strip()) > 3]
                                             colloquial_count = len(valid_expressions)
                                         else:
@@ -845,61 +844,93 @@ def try_backup_podcast_feeds():
     
     return False
 
+# 메모 파싱용 정규식 (호출마다 패턴 문자열을 다시 찾지 않도록 미리 컴파일)
+# 구어체 표현 부분: "🎯 B2 구어체: expression (meaning) | expression2 (meaning2)"
+_COLLOQUIAL_MEMO_RE = re.compile(r'🎯\s*[A-C][12]\+?\s*구어체:\s*([^🤖]+)')
+_EXPRESSION_SEPARATOR_RE = re.compile(r'\s*[\|,]\s*')
+_PIPE_SEPARATOR_RE = re.compile(r'\s*\|\s*')
+
+# 이모지와 메타데이터 패턴들
+_MEMO_METADATA_RES = [re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r'🎧.*?팟캐스트',
+    r'📺.*?에피소드.*?:',
+    r'⏱️.*?재생시간.*?:',
+    r'🎯.*?학습목표.*?:',
+    r'🌍.*?주제.*?:',
+    r'🎯.*?구어체.*?:',
+    r'🤖.*?AI 분석',
+    r'🔍.*?검색어.*?:',
+    r'📻.*?권장.*?:',
+    r'💡.*?추천.*?:',
+    r'📝.*?메모.*?:',
+    r'⭐.*?평점.*?:',
+    r'📅.*?날짜.*?:',
+    r'🏷️.*?태그.*?:',
+    r'📊.*?통계.*?:',
+    r'🔗.*?링크.*?:',
+    r'👤.*?발표자.*?:',
+    r'🏢.*?출처.*?:',
+)]
+_CLOCK_RE = re.compile(r'\d+:\d+')
+_CLOCK_PAREN_RE = re.compile(r'\([^)]*\d+:\d+[^)]*\)')
+_EXPRESSION_LIST_RE = re.compile(r'[a-záéíóúñü\s]+\s*\([^)]+\)\s*\|?', re.IGNORECASE)
+_ENGLISH_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_MEMO_EMOJI_RE = re.compile(r'[🎧📺⏱️🎯🌍🤖🔍📻💡📝⭐📅🏷️📊🔗👤🏢]')
+_ARROW_PIPE_RE = re.compile(r'[→|]')
+_NUMBER_LINE_RE = re.compile(r'^\d+$', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_LINE_EDGE_SPACE_RE = re.compile(r'^\s+|\s+$', re.MULTILINE)
+
+# 스페인어 특징적 패턴 (2개 이상 맞으면 스페인어 문장)
+_SPANISH_LINE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(el|la|los|las|un|una|de|del|en|con|por|para|que|es|son|está|están|tiene|tienen|hace|haz|hacer|ver|ir|venir|poder|querer|saber|conocer|dar|decir|hablar|vivir|trabajar|estudiar|comer|beber|dormir)\b',
+    r'[ñáéíóú]',  # 스페인어 특수 문자
+    r'\b(muy|más|menos|todo|todos|todas|cada|algún|alguna|ningún|ninguna|otro|otra|mismo|misma)\b',
+)]
+
+# 스페인어(한글) 쌍 추출
+_SPANISH_KOREAN_PAIR_RE = re.compile(r'([a-zA-ZáéíóúñüÁÉÍÓÚÑÜ¡¿!.,\s]+?)\s*\(([^)]+)\)')
+_SPANISH_LETTER_RE = re.compile(r'[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]')
+_EDGE_PUNCTUATION_RE = re.compile(r'^[^\w¡¿áéíóúñüÁÉÍÓÚÑÜ]+|[^\w!?áéíóúñüÁÉÍÓÚÑÜ]+$')
+_SPANISH_RUN_RE = re.compile(r'[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ¡¿!.,\s]{2,}')
+_KOREAN_MEANING_RE = re.compile(r'\(([^)]*[가-힣][^)]*)\)')
+_SPANISH_EXPRESSION_RES = [re.compile(pattern) for pattern in (
+    r'¡[^!]+!',  # ¡로 시작해서 !로 끝나는 감탄문
+    r'¿[^?]+\?',  # ¿로 시작해서 ?로 끝나는 의문문
+    r'\b[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]{2,}(?:\s+[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]+)*\b',  # 일반 스페인어 단어들
+)]
+
 def extract_spanish_transcript_from_memo(memo):
     """팟캐스트 메모에서 실제 스페인어 transcript 내용만 추출"""
     if not memo:
         return ""
     
-    # 메모에서 다양한 메타데이터 패턴 제거
-    
-    # 이모지와 메타데이터 패턴들
-    metadata_patterns = [
-        r'🎧.*?팟캐스트',
-        r'📺.*?에피소드.*?:',
-        r'⏱️.*?재생시간.*?:',
-        r'🎯.*?학습목표.*?:',
-        r'🌍.*?주제.*?:',
-        r'🎯.*?구어체.*?:',
-        r'🤖.*?AI 분석',
-        r'🔍.*?검색어.*?:',
-        r'📻.*?권장.*?:',
-        r'💡.*?추천.*?:',
-        r'📝.*?메모.*?:',
-        r'⭐.*?평점.*?:',
-        r'📅.*?날짜.*?:',
-        r'🏷️.*?태그.*?:',
-        r'📊.*?통계.*?:',
-        r'🔗.*?링크.*?:',
-        r'👤.*?발표자.*?:',
-        r'🏢.*?출처.*?:',
-    ]
-    
     content = memo
     
     # 메타데이터 패턴 제거
-    for pattern in metadata_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE)
+    for pattern in _MEMO_METADATA_RES:
+        content = pattern.sub('', content)
     
     # 시간 표기 패턴 제거 (24:39, (전체 24:39 청취) 등)
-    content = re.sub(r'\d+:\d+', '', content)
-    content = re.sub(r'\([^)]*\d+:\d+[^)]*\)', '', content)
+    content = _CLOCK_RE.sub('', content)
+    content = _CLOCK_PAREN_RE.sub('', content)
     
     # 구어체 표현 목록 패턴 제거 (a ver (한번 보자) | por el contrario 등)
-    content = re.sub(r'[a-záéíóúñü\s]+\s*\([^)]+\)\s*\|?', '', content, flags=re.IGNORECASE)
+    content = _EXPRESSION_LIST_RE.sub('', content)
     
     # 영어 단어들 제거 (메타데이터에 섞인 영어)
-    content = re.sub(r'\b[a-zA-Z]+\b', '', content)
+    content = _ENGLISH_WORD_RE.sub('', content)
     
     # 특수 문자와 이모지 제거
-    content = re.sub(r'[🎧📺⏱️🎯🌍🤖🔍📻💡📝⭐📅🏷️📊🔗👤🏢]', '', content)
-    content = re.sub(r'[→|]', '', content)
+    content = _MEMO_EMOJI_RE.sub('', content)
+    content = _ARROW_PIPE_RE.sub('', content)
     
     # 숫자만 있는 라인 제거
-    content = re.sub(r'^\d+$', '', content, flags=re.MULTILINE)
+    content = _NUMBER_LINE_RE.sub('', content)
     
     # 빈 라인들 정리
-    content = re.sub(r'\n\s*\n', '\n', content)
-    content = re.sub(r'^\s+|\s+$', '', content, flags=re.MULTILINE)
+    content = _BLANK_LINES_RE.sub('\n', content)
+    content = _LINE_EDGE_SPACE_RE.sub('', content)
     
     # 최종 정리
     content = content.strip()
@@ -914,15 +945,9 @@ def extract_spanish_transcript_from_memo(memo):
             continue
             
         # 스페인어 특징적 패턴 확인
-        spanish_indicators = [
-            r'\b(el|la|los|las|un|una|de|del|en|con|por|para|que|es|son|está|están|tiene|tienen|hace|haz|hacer|ver|ir|venir|poder|querer|saber|conocer|dar|decir|hablar|vivir|trabajar|estudiar|comer|beber|dormir)\b',
-            r'[ñáéíóú]',  # 스페인어 특수 문자
-            r'\b(muy|más|menos|todo|todos|todas|cada|algún|alguna|ningún|ninguna|otro|otra|mismo|misma)\b'
-        ]
-        
         spanish_score = 0
-        for pattern in spanish_indicators:
-            if re.search(pattern, line, re.IGNORECASE):
+        for pattern in _SPANISH_LINE_RES:
+            if pattern.search(line):
                 spanish_score += 1
         
         # 스페인어 스코어가 2 이상이면 스페인어 문장으로 판단
@@ -940,8 +965,7 @@ def extract_colloquial_expressions_from_memo(memo):
     expressions = []
     
     # 메모에서 구어체 표현 패턴 찾기: "🎯 B2 구어체: expression (meaning) | expression2 (meaning2)"
-    colloquial_pattern = r'🎯\s*[A-C][12]\+?\s*구어체:\s*([^🤖]+)'
-    match = re.search(colloquial_pattern, memo)
+    match = _COLLOQUIAL_MEMO_RE.search(memo)
     
     if match:
         colloquial_text = match.group(1).strip()
@@ -960,7 +984,7 @@ def parse_colloquial_expressions(text):
     expressions = []
     
     # 먼저 | 로 기본 분리 시도
-    raw_parts = re.split(r'\s*\|\s*', text)
+    raw_parts = _PIPE_SEPARATOR_RE.split(text)
     
     for part in raw_parts:
         part = part.strip()
@@ -988,26 +1012,25 @@ def extract_spanish_korean_pairs(text):
     expressions = []
     
     # 패턴 1: 완전한 형태 "스페인어 (한글)"
-    complete_pattern = r'([a-zA-ZáéíóúñüÁÉÍÓÚÑÜ¡¿!.,\s]+?)\s*\(([^)]+)\)'
-    complete_matches = re.findall(complete_pattern, text)
+    complete_matches = _SPANISH_KOREAN_PAIR_RE.findall(text)
     
     for spanish, korean in complete_matches:
         spanish = spanish.strip()
         korean = korean.strip()
         
         # 유효한 스페인어인지 확인 (최소 2글자 이상, 스페인어 문자 포함)
-        if len(spanish) >= 2 and re.search(r'[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]', spanish):
+        if len(spanish) >= 2 and _SPANISH_LETTER_RE.search(spanish):
             # 불필요한 문자 제거
-            spanish = re.sub(r'^[^\w¡¿áéíóúñüÁÉÍÓÚÑÜ]+|[^\w!?áéíóúñüÁÉÍÓÚÑÜ]+$', '', spanish)
+            spanish = _EDGE_PUNCTUATION_RE.sub('', spanish)
             if spanish:
                 expressions.append(f"{spanish} ({korean})")
     
     # 패턴 2: 분리된 형태 처리 (괄호가 떨어져 있는 경우)
     if not complete_matches:
         # 스페인어 부분들을 찾고
-        spanish_parts = re.findall(r'[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ¡¿!.,\s]{2,}', text)
+        spanish_parts = _SPANISH_RUN_RE.findall(text)
         # 한글 부분들을 찾기
-        korean_parts = re.findall(r'\(([^)]*[가-힣][^)]*)\)', text)
+        korean_parts = _KOREAN_MEANING_RE.findall(text)
         
         # 개수가 맞으면 매칭
         if len(spanish_parts) == len(korean_parts):
@@ -1016,7 +1039,7 @@ def extract_spanish_korean_pairs(text):
                 korean = korean.strip()
                 
                 if len(spanish) >= 2 and korean:
-                    spanish = re.sub(r'^[^\w¡¿áéíóúñüÁÉÍÓÚÑÜ]+|[^\w!?áéíóúñüÁÉÍÓÚÑÜ]+$', '', spanish)
+                    spanish = _EDGE_PUNCTUATION_RE.sub('', spanish)
                     if spanish:
                         expressions.append(f"{spanish} ({korean})")
     
@@ -1026,19 +1049,12 @@ def extract_spanish_korean_pairs(text):
         # 예: "¡Pero que morro tienes tío! (너 진짜 뻔뻔하다 친구!)"
         
         # 스페인어 감탄사나 표현들 찾기
-        spanish_expr_patterns = [
-            r'¡[^!]+!',  # ¡로 시작해서 !로 끝나는 감탄문
-            r'¿[^?]+\?',  # ¿로 시작해서 ?로 끝나는 의문문
-            r'\b[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]{2,}(?:\s+[a-zA-ZáéíóúñüÁÉÍÓÚÑÜ]+)*\b'  # 일반 스페인어 단어들
-        ]
-        
         potential_spanish = []
-        for pattern in spanish_expr_patterns:
-            matches = re.findall(pattern, text)
-            potential_spanish.extend(matches)
+        for pattern in _SPANISH_EXPRESSION_RES:
+            potential_spanish.extend(pattern.findall(text))
         
         # 한글 의미들 찾기
-        korean_meanings = re.findall(r'\(([^)]*[가-힣][^)]*)\)', text)
+        korean_meanings = _KOREAN_MEANING_RE.findall(text)
         
         # 가장 긴 스페인어 표현과 의미 매칭
         if potential_spanish and korean_meanings:
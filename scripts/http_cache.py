@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP cache for RSS feeds and shared HTTP sessions.
+Keeps ETag/Last-Modified validators next to the cached body so that repeated
+collect_materials.py runs (alternative_finder retries, Notion fallbacks)
+revalidate with a conditional GET instead of downloading every feed again.
+Parsed feeds are pickled as well, so an unchanged feed is not re-parsed either.
+"""
+import os
+import json
+import time
+import pickle
+import hashlib
+import threading
+from email.utils import parsedate_to_datetime
+
+import requests
+import feedparser
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers, Retry
+
+# orjson이 있으면 JSON 응답을 더 빠르게 디코딩 (없으면 표준 json 사용)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 캐시 위치 (SPANISH_LEARNING_CACHE_DIR로 변경 가능)
+CACHE_ROOT = os.environ.get('SPANISH_LEARNING_CACHE_DIR') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'spanish-learning')
+FEED_CACHE_DIR = os.path.join(CACHE_ROOT, 'feeds')
+ARTICLE_CACHE_DIR = os.path.join(CACHE_ROOT, 'articles')
+PARSED_FEED_DIR = os.path.join(CACHE_ROOT, 'feed_entries')
+
+# 요청이 429(rate limit)로 거절되어 아무것도 수집하지 못했을 때의 종료 코드
+RATE_LIMITED_EXIT_CODE = 42
+
+# 이번 실행에서 받은 429 응답의 Retry-After 중 최대값 (초, 헤더가 없으면 0)
+_retry_after = None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# 모든 세션 요청의 기본 헤더 - 압축은 urllib3가 풀 수 있는 방식만 요청 (brotli가 설치되어 있으면 br 포함)
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+}
+
+# 요청 종류별 Accept 헤더
+HTML_HEADERS = {'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8'}
+JSON_HEADERS = {'Accept': 'application/json'}
+
+# 세션마다 keep-alive 연결을 유지할 호스트 수 (피드, 기사, iTunes, Apple, YouTube 등 - 기본값 10보다 많음)
+POOL_HOSTS = 32
+
+# 연결/읽기 오류 재시도 (GET/HEAD 같은 멱등 요청만 - LLM/Notion POST는 중복 호출하지 않음)
+# 429/503 응답은 재시도하지 않고 그대로 반환 (Retry-After만큼 잠들지 않고 호출한 쪽에서 rate limit을 기록)
+RETRY_POLICY = Retry(total=2, backoff_factor=0.3, status=0, respect_retry_after_header=False)
+
+# 스레드별 HTTP 세션 (keep-alive로 같은 호스트에 다시 연결하는 비용 절감)
+_thread_local = threading.local()
+
+def get_session():
+    """현재 스레드의 requests.Session 반환 (없으면 생성)"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=POOL_HOSTS, max_retries=RETRY_POLICY)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _thread_local.session = session
+    return session
+
+def response_json(response):
+    """응답 본문을 JSON으로 디코딩 (response.json() 대신 사용)"""
+    return _json_loads(response.content)
+
+def _entry_path(cache_dir, url):
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}.cache")
+
+def _load_entry(cache_dir, url):
+    """캐시 항목 읽기 - 첫 줄은 메타데이터(JSON), 나머지는 응답 본문"""
+    try:
+        with open(_entry_path(cache_dir, url), 'rb') as f:
+            meta = json.loads(f.readline())
+            body = f.read()
+        return meta, body
+    except (OSError, ValueError):
+        return None, None
+
+def _store_entry(cache_dir, url, meta, body):
+    """메타데이터와 본문을 한 파일에 원자적으로 저장 (동시 실행되는 프로브끼리 안전)"""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = _entry_path(cache_dir, url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(meta).encode('utf-8') + b'\n')
+            f.write(body)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ 캐시 저장 실패 ({url}): {e}")
+
+def record_rate_limit(response):
+    """429 응답의 Retry-After (초 또는 HTTP 날짜) 기록"""
+    global _retry_after
+    value = response.headers.get('Retry-After', '').strip()
+    try:
+        seconds = int(value)
+    except ValueError:
+        try:
+            seconds = int(parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            seconds = 0
+    _retry_after = max(_retry_after or 0, seconds, 0)
+
+def rate_limit_retry_after():
+    """rate limit에 걸렸으면 대기할 시간(초), 걸리지 않았으면 None"""
+    return _retry_after
+
+# 크기 제한이 있는 본문을 읽을 때의 청크 크기
+READ_CHUNK_BYTES = 64 * 1024
+
+def _read_body(response, max_bytes):
+    """응답 본문 읽기 - max_bytes가 있으면 그 크기까지만 받고 나머지는 다운로드하지 않음
+
+    chunked 응답은 iter_content가 HTTP 청크 단위로 돌려주므로 max_bytes가 찰 때까지 이어 붙임
+    """
+    if max_bytes is None:
+        return response.content
+    body = bytearray()
+    for chunk in response.iter_content(min(max_bytes, READ_CHUNK_BYTES)):
+        body += chunk[:max_bytes - len(body)]
+        if len(body) >= max_bytes:
+            break
+    return bytes(body)
+
+def fetch_capped(url, max_bytes, headers=None, timeout=10):
+    """GET 요청의 본문을 max_bytes까지만 받아 (status_code, body, text) 반환
+
+    text는 응답 헤더의 charset(없으면 UTF-8)으로 디코딩 - 잘린 마지막 문자는 대체 문자로 처리
+    """
+    with get_session().get(url, headers=headers, timeout=timeout, stream=True) as response:
+        body = _read_body(response, max_bytes)
+        encoding = response.encoding or 'utf-8'
+    try:
+        text = body.decode(encoding, errors='replace')
+    except LookupError:
+        text = body.decode('utf-8', errors='replace')
+    return response.status_code, body, text
+
+def conditional_get(url, cache_dir=FEED_CACHE_DIR, timeout=15, max_bytes=None, max_age=0):
+    """조건부 GET - 변경이 없으면(304) 또는 TTL 이내면 캐시된 본문을 재사용
+
+    max_age: 새로 받은 본문을 재검증 없이 재사용할 시간(초) - 0이면 매번 조건부 요청
+    Returns: (status_code, body, meta) - 실패 시 body는 None
+    """
+    meta, body = _load_entry(cache_dir, url)
+
+    if meta and time.time() - meta.get('fetched_at', 0) < meta.get('max_age', 0):
+        return 200, body, meta
+
+    headers = {}
+    if meta:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        with get_session().get(url, headers=headers, timeout=timeout, stream=True) as response:
+            new_body = _read_body(response, max_bytes)
+    except requests.RequestException as e:
+        if meta:
+            # 네트워크 오류 시 오래된 캐시라도 사용
+            print(f"⚠️ 요청 실패, 캐시된 본문 사용 ({url}): {e}")
+            return 200, body, meta
+        raise
+
+    if response.status_code == 304 and meta:
+        meta['fetched_at'] = time.time()
+        meta['max_age'] = max(meta.get('max_age', 0), max_age)
+        _store_entry(cache_dir, url, meta, body)
+        return 200, body, meta
+
+    if response.status_code == 429:
+        record_rate_limit(response)
+
+    if response.status_code != 200:
+        return response.status_code, None, None
+
+    meta = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'fetched_at': time.time(),
+        'max_age': max_age,
+    }
+    _store_entry(cache_dir, url, meta, new_body)
+    return 200, new_body, meta
+
+def _feed_ttl_seconds(feed):
+    """피드의 <ttl> (분 단위)을 초로 변환"""
+    try:
+        return int(feed.feed.get('ttl', 0)) * 60
+    except (TypeError, ValueError):
+        return 0
+
+def _parse_feed_cached(url, body):
+    """본문이 지난번과 같으면(304/TTL 재사용) 저장해 둔 파싱 결과를 사용, 아니면 파싱 후 저장"""
+    digest = hashlib.sha1(body).hexdigest()
+    path = os.path.join(PARSED_FEED_DIR, f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.pickle")
+    try:
+        with open(path, 'rb') as f:
+            cached_digest, feed = pickle.load(f)
+        if cached_digest == digest:
+            return feed
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+
+    # 제목/요약 텍스트만 사용하므로 HTML 정화와 상대 URI 변환은 생략 (항목이 많은 피드에서 비용이 큼)
+    feed = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False)
+
+    # 파싱 오류가 있는 피드는 예외 객체를 pickle할 수 없는 경우가 있어 저장하지 않음
+    if not feed.bozo:
+        try:
+            os.makedirs(PARSED_FEED_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((digest, feed), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"⚠️ 파싱된 피드 저장 실패 ({url}): {e}")
+    return feed
+
+# 이번 실행에서 이미 파싱한 피드 (URL → 결과) - 같은 피드를 여러 번 찾는 백업/대안 검색용
+_feed_memo = {}
+_feed_memo_lock = threading.Lock()
+
+def fetch_feed(url, timeout=15):
+    """RSS 피드를 캐시를 거쳐 가져와 feedparser로 파싱
+
+    feedparser.parse(url)과 같은 형태의 결과를 반환 (status 포함)
+    같은 실행 안에서 다시 요청하면 파싱된 결과를 그대로 재사용
+    (200 응답에 항목이 있는 피드만 재사용 - 요청 실패, 429 등 200이 아닌 응답, 빈 피드는 다시 요청)
+    """
+    with _feed_memo_lock:
+        feed = _feed_memo.get(url)
+    if feed is not None:
+        return feed
+
+    try:
+        status, body, meta = conditional_get(url, FEED_CACHE_DIR, timeout=timeout)
+    except requests.RequestException as e:
+        print(f"⚠️ 피드 요청 실패 ({url}): {e}")
+        feed = feedparser.parse(b'')
+        feed['bozo'] = 1
+        feed['bozo_exception'] = e
+        return feed
+
+    feed = _parse_feed_cached(url, body or b'')
+    feed['status'] = status
+
+    # 피드가 <ttl>을 명시하면 그 시간 동안은 재검증 없이 재사용
+    ttl = _feed_ttl_seconds(feed)
+    if meta and ttl and meta.get('max_age') != ttl:
+        meta['max_age'] = ttl
+        _store_entry(FEED_CACHE_DIR, url, meta, body)
+
+    if status != 200 or not feed.entries:
+        return feed
+    with _feed_memo_lock:
+        return _feed_memo.setdefault(url, feed)
+
+def prefetch_feed(url, timeout=15):
+    """피드를 미리 받아 캐시에 저장 (파싱하지 않음) - 실패는 무시"""
+    try:
+        status, body, _ = conditional_get(url, FEED_CACHE_DIR, timeout=timeout)
+        return status == 200
+    except requests.RequestException:
+        return False
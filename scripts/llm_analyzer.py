@@ -12,6 +12,86 @@ import unicodedata
 import html
 from typing import List, Dict, Optional
 
+from http_cache import get_session
+
+# 이중 언어 콘텐츠에서 스페인어 문장을 판별하는 특징 단어들
+_SPANISH_SENTENCE_INDICATORS = frozenset([
+    'hola', 'queridos', 'amigos', 'bienvenidos', 'español', 'episodio',
+    'soy', 'desde', 'barcelona', 'reflexionamos', 'situación', 'dramática',
+    'mundo', 'entero', 'pandemia', 'coronavirus', 'que', 'está', 'pasando',
+    'nuestro', 'sobre', 'viviendo', 'raíz', 'del'
+])
+
+# 단어 앞뒤에서 제거할 구두점
+_WORD_PUNCTUATION = '.,!?";:()[]'
+
+# 스페인어에만 있는 문자
+_SPANISH_CHARS = frozenset('ñáéíóúü¿¡')
+
+def _has_spanish_indicators(sentence: str, minimum: int = 2) -> bool:
+    """문장에 스페인어 특징 단어가 minimum개 이상 있는지 확인 (찾는 즉시 종료)"""
+    count = 0
+    for word in sentence.lower().split():
+        if word.strip(_WORD_PUNCTUATION) in _SPANISH_SENTENCE_INDICATORS:
+            count += 1
+            if count >= minimum:
+                return True
+    return False
+
+def _count_present(text: str, keywords, limit: int) -> int:
+    """text에 들어 있는 키워드 수를 limit까지만 셈 (limit에 도달하면 나머지는 확인하지 않음)"""
+    count = 0
+    for keyword in keywords:
+        if keyword in text:
+            count += 1
+            if count >= limit:
+                break
+    return count
+
+# 메타데이터 특징 키워드들
+_METADATA_INDICATORS = (
+    'podcast', 'episodio', 'episode', 'title', 'description',
+    'duration', 'fecha', 'date', 'published', 'autor', 'author',
+    'categoria', 'category', 'tags', 'subscribe', 'suscribirse',
+    'web:', 'website:', 'email:', 'twitter:', 'instagram:',
+    'available on', 'disponible en', 'spotify', 'apple podcasts',
+    'google podcasts', 'rss feed', 'feed rss'
+)
+
+# 실제 내용 특징 키워드들
+_CONTENT_INDICATORS = (
+    'hola', 'bienvenidos', 'hoy vamos', 'en este episodio',
+    'quiero hablar', 'vamos a ver', 'como ya sabes',
+    'bueno', 'entonces', 'por ejemplo', 'además', 'también'
+)
+
+# 대화체 특징
+_CONVERSATIONAL_FEATURES = (
+    'hola', 'bueno', 'pues', 'entonces', 'o sea', 'sabes',
+    'verdad', 'claro', 'por cierto', 'a ver', 'vamos'
+)
+
+# 정식/공식 특징
+_FORMAL_FEATURES = (
+    'según', 'mediante', 'por tanto', 'sin embargo', 'además',
+    'asimismo', 'por consiguiente', 'en consecuencia', 'no obstante'
+)
+
+# 설명문 특징
+_DESCRIPTIVE_FEATURES = (
+    'descripción', 'resumen', 'tema', 'sobre', 'acerca de',
+    'información', 'datos', 'estadísticas'
+)
+
+# 구어체 가능성 지표 - 구어체 표현, 질문 형태(구어체에서 흔함), 감탄사나 간투사
+_COLLOQUIAL_LIKELIHOOD_INDICATORS = (
+    'bueno', 'pues', 'entonces', 'o sea', 'sabes', 'verdad',
+    'claro', 'por cierto', 'a ver', 'vamos', 'oye', 'mira',
+    'que tal', 'como va', 'vale', 'está bien', 'de acuerdo',
+    '¿', '?', 'qué', 'cómo', 'dónde', 'cuándo', 'por qué',
+    '¡', '!', 'oh', 'ah', 'eh', 'uf', 'ay'
+)
+
 class SpanishLLMAnalyzer:
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -49,7 +129,7 @@ class SpanishLLMAnalyzer:
                 "top_p": 0.9
             }
             
-            response = requests.post(self.base_url, headers=self.headers, json=payload, timeout=30)
+            response = get_session().post(self.base_url, headers=self.headers, json=payload, timeout=30)
             response.raise_for_status()
             
             result = response.json()
@@ -345,10 +425,10 @@ Provide detailed explanations for each grammar point including specific words fr
             "grammar_analysis": grammar_analysis
         }
     
-    def analyze_text_difficulty(self, content: str) -> str:
+    def analyze_text_difficulty(self, content: str) -> Optional[str]:
         """
         Analyze text difficulty using LLM
-        LLM을 사용한 텍스트 난이도 분석
+        LLM을 사용한 텍스트 난이도 분석 (API 호출 실패나 레벨이 없는 응답이면 None)
         """
         if not content:
             return "B2"
@@ -383,7 +463,7 @@ Respond with only the CEFR level (e.g., "B2" or "B2+" or "C1"), no additional te
                 if level in response:
                     return level
         
-        return "B2"  # 기본값
+        return None
     
     def clean_text(self, text: str) -> str:
         """
@@ -631,14 +711,6 @@ Instructions:
         if not text:
             return ""
         
-        # 스페인어 특징적인 단어들
-        spanish_indicators = [
-            'hola', 'queridos', 'amigos', 'bienvenidos', 'español', 'episodio',
-            'soy', 'desde', 'barcelona', 'reflexionamos', 'situación', 'dramática',
-            'mundo', 'entero', 'pandemia', 'coronavirus', 'que', 'está', 'pasando',
-            'nuestro', 'sobre', 'viviendo', 'raíz', 'del'
-        ]
-        
         # 텍스트를 문장 단위로 분할
         sentences = text.split('.')
         spanish_sentences = []
@@ -648,21 +720,11 @@ Instructions:
             if len(sentence) < 10:  # 너무 짧은 문장 제외
                 continue
             
-            # 각 문장에서 스페인어 특징 단어 개수 세기
-            spanish_word_count = 0
-            words = sentence.lower().split()
-            
-            for word in words:
-                # 구두점 제거
-                clean_word = word.strip('.,!?";:()[]')
-                if clean_word in spanish_indicators:
-                    spanish_word_count += 1
-            
             # 스페인어 특징 단어가 2개 이상이면 스페인어 문장으로 간주
-            if spanish_word_count >= 2:
+            if _has_spanish_indicators(sentence):
                 spanish_sentences.append(sentence)
             # 특징 단어가 적어도 스페인어 문자가 있으면 포함
-            elif any(char in sentence for char in 'ñáéíóúü¿¡'):
+            elif not _SPANISH_CHARS.isdisjoint(sentence):
                 spanish_sentences.append(sentence)
         
         # 스페인어 문장들을 다시 합치기
@@ -686,28 +748,12 @@ Instructions:
         
         text_lower = text.lower()
         
-        # 메타데이터 특징 키워드들
-        metadata_indicators = [
-            'podcast', 'episodio', 'episode', 'title', 'description',
-            'duration', 'fecha', 'date', 'published', 'autor', 'author',
-            'categoria', 'category', 'tags', 'subscribe', 'suscribirse',
-            'web:', 'website:', 'email:', 'twitter:', 'instagram:',
-            'available on', 'disponible en', 'spotify', 'apple podcasts',
-            'google podcasts', 'rss feed', 'feed rss'
-        ]
-        
-        # 실제 내용 특징 키워드들
-        content_indicators = [
-            'hola', 'bienvenidos', 'hoy vamos', 'en este episodio',
-            'quiero hablar', 'vamos a ver', 'como ya sabes',
-            'bueno', 'entonces', 'por ejemplo', 'además', 'también'
-        ]
-        
-        metadata_count = sum(1 for indicator in metadata_indicators if indicator in text_lower)
-        content_count = sum(1 for indicator in content_indicators if indicator in text_lower)
+        # 실제 내용 특징이 2개 이상이면 메타데이터가 아님 - 이후 키워드는 확인하지 않음
+        if _count_present(text_lower, _CONTENT_INDICATORS, 2) > 1:
+            return False
         
         # 메타데이터 특징이 많고 실제 내용 특징이 적으면 메타데이터로 판단
-        return metadata_count >= 3 and content_count <= 1
+        return _count_present(text_lower, _METADATA_INDICATORS, 3) >= 3
     
     def analyze_text_type(self, text: str) -> str:
         """
@@ -718,33 +764,12 @@ Instructions:
         
         text_lower = text.lower()
         
-        # 대화체 특징
-        conversational_features = [
-            'hola', 'bueno', 'pues', 'entonces', 'o sea', 'sabes',
-            'verdad', 'claro', 'por cierto', 'a ver', 'vamos'
-        ]
-        
-        # 정식/공식 특징
-        formal_features = [
-            'según', 'mediante', 'por tanto', 'sin embargo', 'además',
-            'asimismo', 'por consiguiente', 'en consecuencia', 'no obstante'
-        ]
-        
-        # 설명문 특징
-        descriptive_features = [
-            'descripción', 'resumen', 'tema', 'sobre', 'acerca de',
-            'información', 'datos', 'estadísticas'
-        ]
-        
-        conv_score = sum(1 for feature in conversational_features if feature in text_lower)
-        formal_score = sum(1 for feature in formal_features if feature in text_lower)
-        desc_score = sum(1 for feature in descriptive_features if feature in text_lower)
-        
-        if conv_score >= 3:
+        # 앞 단계 판정이 나면 다음 특징 목록은 확인하지 않음
+        if _count_present(text_lower, _CONVERSATIONAL_FEATURES, 3) >= 3:
             return "대화체/비공식 (구어체 표현 가능성 높음)"
-        elif formal_score >= 2:
+        elif _count_present(text_lower, _FORMAL_FEATURES, 2) >= 2:
             return "정식/공식적 (구어체 표현 가능성 낮음)"
-        elif desc_score >= 2:
+        elif _count_present(text_lower, _DESCRIPTIVE_FEATURES, 2) >= 2:
             return "설명문/메타데이터 (구어체 표현 가능성 매우 낮음)"
         else:
             return "혼합형 (구어체 표현 가능성 보통)"
@@ -758,24 +783,8 @@ Instructions:
         
         text_lower = text.lower()
         
-        # 구어체 표현 지표들
-        colloquial_indicators = [
-            'bueno', 'pues', 'entonces', 'o sea', 'sabes', 'verdad',
-            'claro', 'por cierto', 'a ver', 'vamos', 'oye', 'mira',
-            'que tal', 'como va', 'vale', 'está bien', 'de acuerdo'
-        ]
-        
-        # 질문 형태 (구어체에서 흔함)
-        question_patterns = ['¿', '?', 'qué', 'cómo', 'dónde', 'cuándo', 'por qué']
-        
-        # 감탄사나 간투사
-        interjections = ['¡', '!', 'oh', 'ah', 'eh', 'uf', 'ay']
-        
-        colloquial_score = sum(1 for indicator in colloquial_indicators if indicator in text_lower)
-        question_score = sum(1 for pattern in question_patterns if pattern in text_lower)
-        interjection_score = sum(1 for interjection in interjections if interjection in text_lower)
-        
-        total_score = colloquial_score + question_score + interjection_score
+        # 5개를 찾으면 최고 등급이므로 나머지 지표는 확인하지 않음
+        total_score = _count_present(text_lower, _COLLOQUIAL_LIKELIHOOD_INDICATORS, 5)
         
         if total_score >= 5:
             return "높음 (5+ 지표)"
@@ -0,0 +1,71 @@
+import subprocess
+
+import alternative_finder
+
+
+def _timeout_probe(timeouts):
+    """이름별로 지정한 시간에서 시간 초과되는 가짜 _probe"""
+    def probe(name, overrides, timeout, deadline, cancel):
+        raise subprocess.TimeoutExpired(['collect_materials.py'], timeouts[name])
+    return probe
+
+
+def test_full_timeout_marks_candidate_failed(monkeypatch):
+    monkeypatch.setattr(alternative_finder, '_probe', _timeout_probe({'slow': 90}))
+    failed = set()
+
+    found = alternative_finder._probe_candidates(None, [('slow', {})], 90, "{name}", failed, [])
+
+    assert not found
+    assert failed == {'slow'}
+
+
+def test_budget_cut_timeout_is_retried_later(monkeypatch):
+    # 공유 예산이 거의 남지 않아 3초만 받은 프로브는 실패로 기록하지 않음
+    monkeypatch.setattr(alternative_finder, '_probe', _timeout_probe({'late': 3}))
+    failed = set()
+
+    found = alternative_finder._probe_candidates(None, [('late', {})], 90, "{name}", failed, [])
+
+    assert not found
+    assert failed == set()
+
+
+def test_probe_hides_github_output_and_collects_results(monkeypatch, tmp_path):
+    monkeypatch.setenv('GITHUB_OUTPUT', str(tmp_path / 'output'))
+    seen_env = {}
+
+    def fake_run_streamed(argv, env, timeout, prefix, cancel=None, on_line=None):
+        seen_env.update(env)
+        for line in ('진행 중...\n', 'ARTICLE_TITLE="Título "citado""\n', 'PODCAST_TITLE="Episodio"\n'):
+            on_line(line)
+        return 0
+
+    monkeypatch.setattr(alternative_finder, '_run_streamed', fake_run_streamed)
+
+    returncode, retry_after, results = alternative_finder._probe(
+        'ABC', {'READING_SOURCE': 'ABC'}, 60, float('inf'), None)
+
+    assert 'GITHUB_OUTPUT' not in seen_env
+    assert seen_env['READING_SOURCE'] == 'ABC'
+    assert (returncode, retry_after) == (0, None)
+    assert results == {'ARTICLE_TITLE': 'Título "citado"', 'PODCAST_TITLE': 'Episodio'}
+
+
+def test_winner_outputs_are_written_by_parent(monkeypatch, tmp_path):
+    output = tmp_path / 'output'
+    monkeypatch.setenv('GITHUB_OUTPUT', str(output))
+    results = {
+        'loser': (1, None, {'ARTICLE_TITLE': 'Perdedor'}),
+        'winner': (0, None, {'ARTICLE_TITLE': 'Ganador', 'ARTICLE_URL': 'https://abc.es/1',
+                             'PODCAST_TITLE': 'Episodio'}),
+    }
+    monkeypatch.setattr(alternative_finder, '_probe',
+                        lambda name, overrides, timeout, deadline, cancel: results[name])
+
+    found = alternative_finder._probe_candidates(
+        None, [('loser', {}), ('winner', {})], 60, "{name}", set(), [], output_prefix='ARTICLE_')
+
+    assert found
+    # 기사 검색이므로 기사 항목만 기록 (팟캐스트 항목은 팟캐스트 검색이 기록)
+    assert output.read_text(encoding='utf-8') == "article_title=Ganador\narticle_url=https://abc.es/1\n"
@@ -0,0 +1,140 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import collect_materials
+import http_cache
+
+
+class FakeAnalyzer:
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.calls = 0
+
+    def analyze_text_difficulty(self, content):
+        self.calls += 1
+        return self.answers.pop(0)
+
+
+@pytest.fixture
+def llm_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setattr(collect_materials, 'LLM_AVAILABLE', True)
+    monkeypatch.setattr(collect_materials, 'LLM_CACHE_PATH', str(tmp_path / 'llm_results.json'))
+    monkeypatch.setattr(collect_materials, '_llm_cache', None)
+
+
+def test_failed_difficulty_analysis_is_not_cached(llm_cache, monkeypatch):
+    analyzer = FakeAnalyzer([None, 'C1'])
+    monkeypatch.setattr(collect_materials, '_analyzer', analyzer)
+
+    # 실패하면 기본값 B2를 쓰지만 캐시하지 않아 다음 호출에서 다시 분석
+    assert collect_materials.analyze_text_difficulty('Texto de prueba') == 'B2'
+    assert collect_materials.analyze_text_difficulty('Texto de prueba') == 'C1'
+    assert collect_materials.analyze_text_difficulty('Texto de prueba') == 'C1'
+    assert analyzer.calls == 2
+
+
+def _track(name, url, collection='Hoy Hablamos'):
+    return {'trackName': name, 'trackViewUrl': url, 'collectionName': collection}
+
+
+def test_broad_itunes_search_rejects_weak_title_match(monkeypatch):
+    # "españa" 한 단어만 겹치는 결과는 사용하지 않고 정확한 검색어로 넘어감
+    results = [_track('Historia de la gastronomía de España', 'https://apple.example/wrong')]
+    monkeypatch.setattr(collect_materials, '_itunes_search', lambda term, limit=50: results)
+
+    url, has_results = collect_materials._find_itunes_episode_broad('Hoy Hablamos', 'Viajar por España en tren')
+
+    assert (url, has_results) == (None, True)
+
+
+def test_broad_itunes_search_accepts_normalized_title(monkeypatch):
+    results = [
+        _track('Viajes: España y Portugal', 'https://apple.example/partial'),
+        _track('Viajar por España, en tren!', 'https://apple.example/exact'),
+    ]
+    monkeypatch.setattr(collect_materials, '_itunes_search', lambda term, limit=50: results)
+
+    url, _ = collect_materials._find_itunes_episode_broad('Hoy Hablamos', 'Viajar por España en tren')
+
+    assert url == 'https://apple.example/exact'
+
+
+def test_itunes_terms_are_searched_in_order_until_first_hit(monkeypatch):
+    searched = []
+
+    def fake_find(term, podcast_name, episode_title):
+        searched.append(term)
+        return 'https://apple.example/ep' if term == 'Viajar por España en tren' else None
+
+    monkeypatch.setattr(collect_materials, '_find_itunes_episode', fake_find)
+    monkeypatch.setattr(collect_materials, '_find_itunes_episode_broad', lambda podcast_name, title: (None, False))
+    monkeypatch.setattr(collect_materials, '_apple_episode_urls', {})
+
+    url = collect_materials.search_apple_podcasts_episode(
+        'Hoy Hablamos', 'Viajar por España en tren', 'https://apple.example/show')
+
+    assert url == 'https://apple.example/ep'
+    # 팟캐스트 이름+제목, 제목 순서로 검색하고 찾은 뒤에는 더 요청하지 않음
+    assert searched == ['Hoy Hablamos Viajar por España en tren', 'Viajar por España en tren']
+
+
+class ItunesRateLimitedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(429)
+        self.send_header('Retry-After', '30')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_itunes_rate_limit_is_recorded(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ItunesRateLimitedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(collect_materials, '_ITUNES_SEARCH_URL', f"http://127.0.0.1:{server.server_address[1]}/search")
+    monkeypatch.setattr(http_cache, '_retry_after', None)
+    try:
+        assert collect_materials._itunes_search('Hoy Hablamos') is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert http_cache.rate_limit_retry_after() == 30
+
+
+def test_apple_episode_lookup_caches_only_hits(monkeypatch):
+    answers = [None, 'https://apple.example/ep']
+    searched = []
+
+    def fake_search(podcast_name, episode_title):
+        searched.append(episode_title)
+        return answers.pop(0)
+
+    monkeypatch.setattr(collect_materials, '_search_apple_podcasts_episode', fake_search)
+    monkeypatch.setattr(collect_materials, '_apple_episode_urls', {})
+    show = 'https://apple.example/show'
+
+    # 실패(show 링크)는 저장하지 않고 다시 검색, 찾은 URL은 저장해서 재사용
+    assert collect_materials.search_apple_podcasts_episode('Hoy Hablamos', 'Episodio', show) == show
+    assert collect_materials.search_apple_podcasts_episode('Hoy Hablamos', 'Episodio', show) == 'https://apple.example/ep'
+    assert collect_materials.search_apple_podcasts_episode('Hoy Hablamos', 'Episodio', show) == 'https://apple.example/ep'
+    assert searched == ['Episodio', 'Episodio']
+
+
+@pytest.mark.parametrize('duration, plan', [
+    ('45:10', '(30분 청취 목표)'),
+    ('18:05', '(전체 18:05 청취)'),
+    ('15-25분', '(25분 청취 목표)'),
+    ('1:02:03', '(25분 청취 목표)'),
+])
+def test_podcast_memo_listen_plan(monkeypatch, duration, plan):
+    monkeypatch.setenv('SKIP_DUPLICATE_CONTENT_COLLECTION', 'true')
+    data = {'podcast_name': 'Hoy Hablamos', 'title': 'Episodio', 'duration': duration, 'url': ''}
+
+    memo = collect_materials.create_detailed_memo('podcast', data, '월요일')
+
+    assert plan in memo
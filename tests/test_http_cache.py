@@ -0,0 +1,122 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_cache
+
+# 4000바이트 청크 50개 (약 200 KB) - 한 번의 읽기로는 다 받을 수 없는 chunked 응답
+CHUNK = b'<p>' + b'x' * 3993 + b'</p>'
+CHUNK_COUNT = 50
+PAGE = CHUNK * CHUNK_COUNT
+
+
+class ChunkedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('ETag', '"page-v1"')
+        self.end_headers()
+        for _ in range(CHUNK_COUNT):
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(CHUNK), CHUNK))
+        self.wfile.write(b'0\r\n\r\n')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def chunked_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ChunkedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/episode"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_capped_reads_past_first_chunk(chunked_url):
+    status, body, text = http_cache.fetch_capped(chunked_url, 512 * 1024)
+    assert status == 200
+    assert body == PAGE
+    assert text == PAGE.decode('utf-8')
+
+
+def test_fetch_capped_stops_at_max_bytes(chunked_url):
+    status, body, _ = http_cache.fetch_capped(chunked_url, 10_000)
+    assert status == 200
+    assert body == PAGE[:10_000]
+
+
+def test_conditional_get_caches_full_capped_body(chunked_url, tmp_path):
+    status, body, meta = http_cache.conditional_get(chunked_url, str(tmp_path), max_bytes=256 * 1024)
+    assert status == 200
+    assert body == PAGE
+    assert meta['etag'] == '"page-v1"'
+
+    cached_meta, cached_body = http_cache._load_entry(str(tmp_path), chunked_url)
+    assert cached_body == PAGE
+    assert cached_meta['etag'] == '"page-v1"'
+
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = 0
+
+    def do_GET(self):
+        RateLimitedHandler.hits += 1
+        self.send_response(429)
+        self.send_header('Retry-After', '1')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_rate_limited_response_is_not_retried(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RateLimitedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(http_cache, '_retry_after', None)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/feed"
+        status, body, meta = http_cache.conditional_get(url, str(tmp_path))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert (status, body, meta) == (429, None, None)
+    assert RateLimitedHandler.hits == 1
+    assert http_cache.rate_limit_retry_after() == 1
+
+
+RSS = b'''<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Episodio 1</title><link>http://example.com/1</link></item>
+</channel></rss>'''
+
+
+def test_fetch_feed_memoizes_only_successful_feeds(monkeypatch, tmp_path):
+    responses = {'http://feeds.test/ok': [(200, RSS)], 'http://feeds.test/limited': [(429, None), (200, RSS)]}
+    calls = []
+
+    def fake_conditional_get(url, cache_dir, timeout=15):
+        calls.append(url)
+        status, body = responses[url].pop(0)
+        return status, body, ({'max_age': 0} if body else None)
+
+    monkeypatch.setattr(http_cache, 'conditional_get', fake_conditional_get)
+    monkeypatch.setattr(http_cache, 'PARSED_FEED_DIR', str(tmp_path))
+    monkeypatch.setattr(http_cache, '_feed_memo', {})
+
+    assert len(http_cache.fetch_feed('http://feeds.test/ok').entries) == 1
+    assert len(http_cache.fetch_feed('http://feeds.test/ok').entries) == 1
+
+    # 429는 재사용하지 않고 다음 호출에서 다시 요청
+    assert http_cache.fetch_feed('http://feeds.test/limited').status == 429
+    assert http_cache.fetch_feed('http://feeds.test/limited').status == 200
+
+    assert calls == ['http://feeds.test/ok', 'http://feeds.test/limited', 'http://feeds.test/limited']